@@ -52,7 +52,8 @@ class HoneypotAgent:
         self.providers = ai.get_available_providers()
         print(f"[AGENT] Initialized with providers: {self.providers}")
     
-    def generate_response(self, conversation_history: str, latest_message: str, metadata: dict = None) -> str:
+    def generate_response(self, conversation_history: str, latest_message: str, metadata: dict = None,
+                          check_factual: bool = True) -> str:
         """
         generate a response to scammer's message
         
@@ -60,6 +61,8 @@ class HoneypotAgent:
             conversation_history: formatted string of previous messages
             latest_message: the new message from scammer
             metadata: optional context (channel, language, etc)
+            check_factual: look up factual questions first (skip when the
+                caller already did it, e.g. via get_factual_answer_async)
         
         returns:
             response string
@@ -83,7 +86,7 @@ class HoneypotAgent:
                 lang_name = get_language_name(detected_lang)
         
         # CHECK: is this a factual question? use FREE APIs first
-        if is_factual_question(latest_message):
+        if check_factual and is_factual_question(latest_message):
             factual_answer = get_humanized_factual_answer(latest_message)
             if factual_answer:
                 print(f"[AGENT] Using factual answer (FREE API)")
@@ -233,9 +236,10 @@ YOUR REPLY (just the message in {language}, nothing else):"""
 agent = HoneypotAgent()
 
 
-def get_agent_response(conversation_history: str, latest_message: str, metadata: dict = None) -> str:
+def get_agent_response(conversation_history: str, latest_message: str, metadata: dict = None,
+                       check_factual: bool = True) -> str:
     """convenience function to get response"""
-    return agent.generate_response(conversation_history, latest_message, metadata)
+    return agent.generate_response(conversation_history, latest_message, metadata, check_factual)
 
 
 # quick test
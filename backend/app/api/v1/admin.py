@@ -272,7 +272,7 @@ async def get_session(
         "status": session.status.value,
         "channel": session.channel,
         "language": session.language,
-        "messages": session.messages,
+        "messages": session.message_list,
         "intel": session.intel,
         "emotional_state": session.emotional_state,
         "callback_sent": session.callback_sent,
@@ -5,13 +5,17 @@ automated conversation management and intelligence gathering.
 handles the complete lifecycle of scam engagement.
 """
 
+import logging
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from app.session_manager import Session
 from app.scam_detector import detect_scam, analyze_conversation
-from app.intelligence import extract_from_conversation, generate_agent_notes
-from app.guvi_callback import send_final_result
+from app.intelligence import generate_agent_notes
+from app.guvi_callback import submit_final_result, get_pending_callback
 from app.config import MIN_MESSAGES_BEFORE_REPORT, AUTO_CALLBACK
 
+logger = logging.getLogger(__name__)
+
 
 class ConversationAutomation:
     """
@@ -74,34 +78,48 @@ class ConversationAutomation:
         
         return False
     
-    def process_callback(self, session: Session) -> dict:
+    def queue_callback(self, session: Session) -> Future:
         """
-        prepare and send callback to guvi.
+        prepare the callback and send it to guvi in the background.
+        session.callback_sent is set once guvi accepts the report.
         """
         
+        # already on its way - don't rebuild or resend
+        pending = get_pending_callback(session.session_id)
+        if pending is not None:
+            return pending
+        
         # get scam analysis
         scam_result = analyze_conversation(session.conversation)
         
-        # extract final intel
-        intel = extract_from_conversation(session.conversation)
-        session.intel = intel
+        # final intel: handle_message already extracted it off the event loop
+        # for the current conversation - don't re-extract inline here
+        intel = session.intel
         
         # generate notes
         agent_notes = generate_agent_notes(intel, scam_result)
         
+        # marked sent inside the callback job, before the pending entry is
+        # released, so a message arriving in between can't trigger a resend
+        def _mark_sent(result: dict):
+            session.callback_sent = True
+            logger.info("[CALLBACK] Sent for session %s", session.session_id)
+        
         # send callback
-        result = send_final_result(
+        return submit_final_result(
             session_id=session.session_id,
             scam_detected=session.scam_detected,
             total_messages=session.message_count,
             intel=intel,
-            agent_notes=agent_notes
+            agent_notes=agent_notes,
+            on_success=_mark_sent
         )
-        
-        if result.get("success"):
-            session.callback_sent = True
-        
-        return result
+    
+    def process_callback(self, session: Session) -> dict:
+        """
+        prepare and send callback to guvi, waiting for the result.
+        """
+        return self.queue_callback(session).result()
     
     def analyze_engagement_quality(self, session: Session) -> dict:
         """
@@ -4,17 +4,26 @@ config.py - Centralized configuration using Pydantic Settings
 Loads all settings from environment variables with defaults.
 """
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
-from typing import Optional, List, Union
-from functools import lru_cache
+from typing import Optional, List, Tuple, Union
 
 
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
+    Frozen after load - settings are read-only at runtime.
     """
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",  # Ignore extra fields in .env
+        frozen=True,
+        validate_default=False,
+    )
+    
     # ============================================================
     # APP SETTINGS
     # ============================================================
@@ -123,25 +132,18 @@ class Settings(BaseSettings):
     # ============================================================
     # SUPPORTED LANGUAGES
     # ============================================================
-    SUPPORTED_LANGUAGES: List[str] = [
+    SUPPORTED_LANGUAGES: Tuple[str, ...] = (
         "en", "hi", "ta", "te", "kn", "ml", "bn", "mr", "gu", "pa"
-    ]
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-        extra = "ignore"  # Ignore extra fields in .env
+    )
+
+
+# Global settings instance - the canonical singleton, import this directly
+settings = Settings()
 
 
-@lru_cache()
 def get_settings() -> Settings:
     """
-    Get cached settings instance.
-    Use this instead of creating new Settings() each time.
+    Get the settings instance.
+    Kept for FastAPI dependency overrides in tests; prefer importing `settings`.
     """
-    return Settings()
-
-
-# Global settings instance
-settings = get_settings()
+    return settings
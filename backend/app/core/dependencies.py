@@ -140,17 +140,23 @@ class RequireSubscription:
         self,
         user: User = Depends(get_current_active_user)
     ) -> User:
-        # Get user's subscription
-        subscription = await Subscription.find_one(
-            Subscription.user_id == str(user.id),
-            Subscription.status == "active"
-        )
+        # Tier is denormalized onto the user document
+        user_tier = user.active_tier
         
-        if not subscription:
+        if user_tier is None:
+            # Legacy document - look up once and backfill
+            subscription = await Subscription.find_one(
+                Subscription.user_id == str(user.id),
+                Subscription.status == "active"
+            )
             # No subscription = free tier
-            user_tier = PlanTier.FREE
-        else:
-            user_tier = subscription.plan_tier
+            user_tier = subscription.plan_tier if subscription else PlanTier.FREE
+            user.active_tier = user_tier
+            # Targeted $set - a full save() here would overwrite concurrent
+            # writes to the user (login timestamps, tokens)
+            await User.find_one(User.id == user.id).update(
+                {"$set": {"active_tier": user_tier.value}}
+            )
         
         # Check tier level
         user_level = self.tier_levels.get(user_tier, 0)
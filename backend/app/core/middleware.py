@@ -4,13 +4,15 @@ middleware.py - Custom middleware for rate limiting, logging, and security
 
 import time
 import logging
+import secrets
 from datetime import datetime, timedelta
 from collections import defaultdict
 from typing import Callable, Dict, Optional
 from fastapi import Request, Response, HTTPException
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-import asyncio
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 
@@ -21,76 +23,134 @@ logger = logging.getLogger("scamshield")
 
 
 # ============================================================
-# RATE LIMITING MIDDLEWARE
+# SECURITY HEADERS
 # ============================================================
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+# Encoded once at import; appended to the raw headers by UnifiedMiddleware
+_SEC_HEADERS = [
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in (
+        ("X-Content-Type-Options", "nosniff"),
+        ("X-Frame-Options", "DENY"),
+        ("X-XSS-Protection", "1; mode=block"),
+        ("Strict-Transport-Security", "max-age=31536000; includeSubDomains"),
+        ("Referrer-Policy", "strict-origin-when-cross-origin"),
+        ("Permissions-Policy", "geolocation=(), microphone=(), camera=()"),
+    )
+]
+
+
+# ============================================================
+# API KEY AUTHENTICATION MIDDLEWARE
+# ============================================================
+
+class APIKeyAuthMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware to authenticate requests using API keys.
+    Checks X-API-Key header for programmatic access.
+    """
+    
+    def __init__(self, app, require_auth_paths: list = None):
+        super().__init__(app)
+        # Paths that require API key authentication (if no Bearer token)
+        self.require_auth_paths = require_auth_paths or ["/api/v1/scans"]
+    
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        # Check if path requires authentication
+        requires_auth = any(
+            request.url.path.startswith(path) 
+            for path in self.require_auth_paths
+        )
+        
+        if not requires_auth:
+            return await call_next(request)
+        
+        # Check for Authorization header (JWT takes priority)
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            return await call_next(request)
+        
+        # Check for API key
+        api_key = request.headers.get("X-API-Key")
+        if api_key:
+            # Validate API key (will be done in dependency)
+            # Just pass through here, actual validation in endpoint
+            return await call_next(request)
+        
+        # No authentication provided for protected route
+        # Let the endpoint handle the 401 response
+        return await call_next(request)
+
+
+# ============================================================
+# UNIFIED MIDDLEWARE (rate limit + logging + security headers)
+# ============================================================
+
+class UnifiedMiddleware:
     """
-    Rate limiting middleware to prevent abuse.
-    Uses in-memory storage (for single instance) or can be extended to Redis.
+    Pure ASGI middleware combining rate limiting, request logging and
+    security headers in a single hop.
+    
+    Each BaseHTTPMiddleware spawns a task and memory stream per request;
+    doing all three jobs here avoids stacking that overhead three times.
+    Headers are injected by wrapping `send` on http.response.start.
     """
     
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         requests_per_minute: int = 60,
         requests_per_hour: int = 1000,
-        whitelist_paths: list = None
+        whitelist_paths: list = None,
+        log_exclude_paths: list = None
     ):
-        super().__init__(app)
+        self.app = app
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
-        self.whitelist_paths = whitelist_paths or ["/health", "/docs", "/openapi.json", "/redoc"]
+        self.whitelist_paths = tuple(
+            whitelist_paths or ["/health", "/docs", "/openapi.json", "/redoc"]
+        )
+        self.log_exclude_paths = tuple(
+            log_exclude_paths or ["/health", "/docs", "/openapi.json", "/redoc"]
+        )
         
-        # In-memory storage: {ip: [(timestamp, count), ...]}
+        # In-memory storage: {ip: [timestamp, ...]}
         self.minute_requests: Dict[str, list] = defaultdict(list)
         self.hour_requests: Dict[str, list] = defaultdict(list)
         
-        # Cleanup task
-        self._cleanup_lock = asyncio.Lock()
+        self._limit_header = str(requests_per_minute).encode("latin-1")
     
-    def _get_client_ip(self, request: Request) -> str:
-        """Get client IP from request, considering proxies."""
-        # Check for forwarded headers (behind proxy/load balancer)
-        forwarded = request.headers.get("X-Forwarded-For")
+    @staticmethod
+    def _get_client_ip(scope: Scope, headers: Headers) -> str:
+        """Get client IP from scope, considering proxies."""
+        forwarded = headers.get("x-forwarded-for")
         if forwarded:
             return forwarded.split(",")[0].strip()
         
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip
         
-        return request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        return client[0] if client else "unknown"
     
-    def _cleanup_old_requests(self, ip: str):
+    def _cleanup_old_requests(self, ip: str, now: float):
         """Remove expired request records."""
-        now = time.time()
         minute_ago = now - 60
         hour_ago = now - 3600
         
-        # Clean minute window
         self.minute_requests[ip] = [
             ts for ts in self.minute_requests[ip] if ts > minute_ago
         ]
-        
-        # Clean hour window
         self.hour_requests[ip] = [
             ts for ts in self.hour_requests[ip] if ts > hour_ago
         ]
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Skip rate limiting for whitelisted paths
-        if any(request.url.path.startswith(path) for path in self.whitelist_paths):
-            return await call_next(request)
-        
-        client_ip = self._get_client_ip(request)
-        now = time.time()
-        
-        # Cleanup old requests
-        self._cleanup_old_requests(client_ip)
+    def _check_rate_limit(self, ip: str, now: float) -> Optional[JSONResponse]:
+        """Record the request, or return a 429 response if over a limit."""
+        self._cleanup_old_requests(ip, now)
         
-        # Check minute limit
-        if len(self.minute_requests[client_ip]) >= self.requests_per_minute:
+        if len(self.minute_requests[ip]) >= self.requests_per_minute:
             return JSONResponse(
                 status_code=429,
                 content={
@@ -102,8 +162,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 headers={"Retry-After": "60"}
             )
         
-        # Check hour limit
-        if len(self.hour_requests[client_ip]) >= self.requests_per_hour:
+        if len(self.hour_requests[ip]) >= self.requests_per_hour:
             return JSONResponse(
                 status_code=429,
                 content={
@@ -115,145 +174,70 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 headers={"Retry-After": "3600"}
             )
         
-        # Record this request
-        self.minute_requests[client_ip].append(now)
-        self.hour_requests[client_ip].append(now)
-        
-        # Add rate limit headers to response
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(
-            self.requests_per_minute - len(self.minute_requests[client_ip])
-        )
-        response.headers["X-RateLimit-Reset"] = str(int(now + 60))
-        
-        return response
-
-
-# ============================================================
-# REQUEST LOGGING MIDDLEWARE
-# ============================================================
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to log all incoming requests for debugging and monitoring.
-    """
-    
-    def __init__(self, app, log_body: bool = False, exclude_paths: list = None):
-        super().__init__(app)
-        self.log_body = log_body
-        self.exclude_paths = exclude_paths or ["/health", "/docs", "/openapi.json", "/redoc"]
+        self.minute_requests[ip].append(now)
+        self.hour_requests[ip].append(now)
+        return None
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Skip logging for excluded paths
-        if any(request.url.path.startswith(path) for path in self.exclude_paths):
-            return await call_next(request)
-        
-        # Record start time
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope["path"]
+        headers = Headers(scope=scope)
+        client_ip = self._get_client_ip(scope, headers)
         start_time = time.time()
         
-        # Get request details
-        client_ip = request.headers.get("X-Forwarded-For", "").split(",")[0].strip() or \
-                   request.headers.get("X-Real-IP") or \
-                   (request.client.host if request.client else "unknown")
+        rate_limited = not path.startswith(self.whitelist_paths)
+        should_log = not path.startswith(self.log_exclude_paths)
         
-        # Generate request ID
-        request_id = f"{int(start_time * 1000)}-{id(request)}"
-        
-        # Log request
-        logger.info(
-            f"[{request_id}] --> {request.method} {request.url.path} "
-            f"| Client: {client_ip} "
-            f"| User-Agent: {request.headers.get('User-Agent', 'unknown')[:50]}"
-        )
+        limited_response = None
+        if rate_limited:
+            limited_response = self._check_rate_limit(client_ip, start_time)
         
-        # Process request
-        try:
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            # Log response
+        request_id = None
+        if should_log:
+            request_id = secrets.token_hex(8)
             logger.info(
-                f"[{request_id}] <-- {response.status_code} "
-                f"| Duration: {duration:.3f}s"
+                f"[{request_id}] --> {scope['method']} {path} "
+                f"| Client: {client_ip} "
+                f"| User-Agent: {headers.get('user-agent', 'unknown')[:50]}"
             )
-            
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            
-            return response
-            
+        
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                extra = list(_SEC_HEADERS)
+                if rate_limited and limited_response is None:
+                    remaining = self.requests_per_minute - len(self.minute_requests[client_ip])
+                    extra.append((b"x-ratelimit-limit", self._limit_header))
+                    extra.append((b"x-ratelimit-remaining", str(remaining).encode("latin-1")))
+                    extra.append((b"x-ratelimit-reset", str(int(start_time + 60)).encode("latin-1")))
+                if request_id is not None:
+                    extra.append((b"x-request-id", request_id.encode("latin-1")))
+                message["headers"] = [*message.get("headers", ()), *extra]
+            await send(message)
+        
+        try:
+            if limited_response is not None:
+                await limited_response(scope, receive, send_wrapper)
+            else:
+                await self.app(scope, receive, send_wrapper)
         except Exception as e:
+            if request_id is not None:
+                duration = time.time() - start_time
+                logger.error(
+                    f"[{request_id}] !!! ERROR: {str(e)} "
+                    f"| Duration: {duration:.3f}s"
+                )
+            raise
+        
+        if request_id is not None:
             duration = time.time() - start_time
-            logger.error(
-                f"[{request_id}] !!! ERROR: {str(e)} "
+            logger.info(
+                f"[{request_id}] <-- {status_code} "
                 f"| Duration: {duration:.3f}s"
             )
-            raise
-
-
-# ============================================================
-# SECURITY HEADERS MIDDLEWARE
-# ============================================================
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """
-    Add security headers to all responses.
-    """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-        
-        return response
-
-
-# ============================================================
-# API KEY AUTHENTICATION MIDDLEWARE
-# ============================================================
-
-class APIKeyAuthMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to authenticate requests using API keys.
-    Checks X-API-Key header for programmatic access.
-    """
-    
-    def __init__(self, app, require_auth_paths: list = None):
-        super().__init__(app)
-        # Paths that require API key authentication (if no Bearer token)
-        self.require_auth_paths = require_auth_paths or ["/api/v1/scans"]
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Check if path requires authentication
-        requires_auth = any(
-            request.url.path.startswith(path) 
-            for path in self.require_auth_paths
-        )
-        
-        if not requires_auth:
-            return await call_next(request)
-        
-        # Check for Authorization header (JWT takes priority)
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            return await call_next(request)
-        
-        # Check for API key
-        api_key = request.headers.get("X-API-Key")
-        if api_key:
-            # Validate API key (will be done in dependency)
-            # Just pass through here, actual validation in endpoint
-            return await call_next(request)
-        
-        # No authentication provided for protected route
-        # Let the endpoint handle the 401 response
-        return await call_next(request)
@@ -4,11 +4,12 @@ security.py - Password hashing and JWT token management
 
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+import time
 import secrets
 import hashlib
 import bcrypt
 
-from jose import JWTError, jwt
+import jwt
 
 from app.core.config import settings
 
@@ -57,17 +58,17 @@ def create_access_token(
         expires_delta: Custom expiration time
         additional_claims: Extra data to include in token
     """
+    # NumericDate ints - one clock read, no datetime conversion in jwt
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
     to_encode = {
         "sub": str(subject),
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": now,
         "type": "access"
     }
     
@@ -94,17 +95,16 @@ def create_refresh_token(
         subject: Usually the user ID
         expires_delta: Custom expiration time
     """
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
+        expire = now + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
     
     to_encode = {
         "sub": str(subject),
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": now,
         "type": "refresh"
     }
     
@@ -131,7 +131,7 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
             algorithms=[settings.JWT_ALGORITHM]
         )
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
@@ -177,9 +177,14 @@ def generate_api_key() -> str:
 def create_scammer_fingerprint_hash(identifiers: list) -> str:
     """
     Create a hash from scammer identifiers for fingerprinting.
+    
+    Works on bytes so each identifier is encoded once. Stays on SHA-256
+    since fingerprint hashes are exposed through the admin API.
     """
     # Sort and join identifiers for consistent hashing
-    sorted_ids = sorted([str(i).lower().strip() for i in identifiers if i])
-    combined = "|".join(sorted_ids)
+    parts = sorted(
+        str(i).encode("utf-8", "ignore").strip().lower()
+        for i in identifiers if i
+    )
     
-    return hashlib.sha256(combined.encode()).hexdigest()
+    return hashlib.sha256(b"|".join(parts)).hexdigest()
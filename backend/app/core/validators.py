@@ -2,7 +2,7 @@
 validators.py - Input validation utilities
 """
 
-import re
+import string
 from typing import Optional, List, Tuple
 from pydantic import validator, field_validator
 
@@ -19,6 +19,7 @@ class PasswordValidator:
     REQUIRE_DIGIT = True
     REQUIRE_SPECIAL = True
     SPECIAL_CHARS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+    _SPECIAL_SET = frozenset(SPECIAL_CHARS)
     
     # Common weak passwords to reject
     COMMON_PASSWORDS = {
@@ -48,28 +49,31 @@ class PasswordValidator:
         if len(password) > cls.MAX_LENGTH:
             errors.append(f"Password must be at most {cls.MAX_LENGTH} characters")
         
+        # Common password check (cheap set lookup, before scanning)
+        if password.lower() in cls.COMMON_PASSWORDS:
+            errors.append("This password is too common. Please choose a stronger password.")
+        
+        # One pass for character classes and repeated runs
+        mask, longest_run = _scan_password(password, stop_run=4)
+        
         # Uppercase check
-        if cls.REQUIRE_UPPERCASE and not re.search(r"[A-Z]", password):
+        if cls.REQUIRE_UPPERCASE and not mask & _CLS_UPPER:
             errors.append("Password must contain at least one uppercase letter")
         
         # Lowercase check
-        if cls.REQUIRE_LOWERCASE and not re.search(r"[a-z]", password):
+        if cls.REQUIRE_LOWERCASE and not mask & _CLS_LOWER:
             errors.append("Password must contain at least one lowercase letter")
         
         # Digit check
-        if cls.REQUIRE_DIGIT and not re.search(r"\d", password):
+        if cls.REQUIRE_DIGIT and not mask & _CLS_DIGIT:
             errors.append("Password must contain at least one digit")
         
         # Special character check
-        if cls.REQUIRE_SPECIAL and not re.search(f"[{re.escape(cls.SPECIAL_CHARS)}]", password):
+        if cls.REQUIRE_SPECIAL and not mask & _CLS_SPECIAL:
             errors.append(f"Password must contain at least one special character ({cls.SPECIAL_CHARS})")
         
-        # Common password check
-        if password.lower() in cls.COMMON_PASSWORDS:
-            errors.append("This password is too common. Please choose a stronger password.")
-        
         # Check for repeated characters
-        if re.search(r"(.)\1{3,}", password):
+        if longest_run >= 4:
             errors.append("Password cannot contain more than 3 repeated characters")
         
         return len(errors) == 0, errors
@@ -95,34 +99,31 @@ class PasswordValidator:
         if len(password) < 12:
             suggestions.append("Use at least 12 characters for better security")
         
+        mask, longest_run = _scan_password(password, stop_run=3)
+        
         # Character variety (up to 40 points)
-        if re.search(r"[a-z]", password):
+        if mask & _CLS_LOWER:
             score += 10
         else:
             suggestions.append("Add lowercase letters")
         
-        if re.search(r"[A-Z]", password):
+        if mask & _CLS_UPPER:
             score += 10
         else:
             suggestions.append("Add uppercase letters")
         
-        if re.search(r"\d", password):
+        if mask & _CLS_DIGIT:
             score += 10
         else:
             suggestions.append("Add numbers")
         
-        if re.search(f"[{re.escape(cls.SPECIAL_CHARS)}]", password):
+        if mask & _CLS_SPECIAL:
             score += 10
         else:
             suggestions.append("Add special characters")
         
         # Bonus for mixing (up to 20 points)
-        char_types = sum([
-            bool(re.search(r"[a-z]", password)),
-            bool(re.search(r"[A-Z]", password)),
-            bool(re.search(r"\d", password)),
-            bool(re.search(f"[{re.escape(cls.SPECIAL_CHARS)}]", password))
-        ])
+        char_types = mask.bit_count()
         score += char_types * 5
         
         # Penalty for common patterns
@@ -130,7 +131,7 @@ class PasswordValidator:
             score = min(score, 10)
             suggestions.append("Avoid common passwords")
         
-        if re.search(r"(.)\1{2,}", password):
+        if longest_run >= 3:
             score -= 10
             suggestions.append("Avoid repeated characters")
         
@@ -153,24 +154,129 @@ class PasswordValidator:
         }
 
 
+# Character class bits for the password scan
+_CLS_LOWER = 1
+_CLS_UPPER = 2
+_CLS_DIGIT = 4
+_CLS_SPECIAL = 8
+_CLS_ALL = _CLS_LOWER | _CLS_UPPER | _CLS_DIGIT | _CLS_SPECIAL
+
+
+def _classify(code: int) -> int:
+    ch = chr(code)
+    if "a" <= ch <= "z":
+        return _CLS_LOWER
+    if "A" <= ch <= "Z":
+        return _CLS_UPPER
+    if "0" <= ch <= "9":
+        return _CLS_DIGIT
+    if ch in PasswordValidator._SPECIAL_SET:
+        return _CLS_SPECIAL
+    return 0
+
+
+# ASCII code point -> class bits
+_CHAR_CLASS_TABLE = bytes(_classify(c) for c in range(128))
+
+
+def _scan_password(password: str, stop_run: int = 0) -> Tuple[int, int]:
+    """
+    Single pass over the password.
+    
+    Stops early once every class has been seen and a run of at least
+    `stop_run` chars was found - nothing later can change the outcome.
+    
+    Returns:
+        Tuple of (character class bitmask, longest run of one repeated char)
+    """
+    table = _CHAR_CLASS_TABLE
+    mask = 0
+    longest = run = 0
+    prev = None
+    for ch in password:
+        code = ord(ch)
+        if code < 128:
+            mask |= table[code]
+        elif ch.isdecimal():
+            # Match regex \d, which also accepts non-ASCII digits
+            mask |= _CLS_DIGIT
+        
+        if ch == prev:
+            run += 1
+            if run > longest:
+                longest = run
+                if stop_run and run >= stop_run and mask == _CLS_ALL:
+                    break
+        else:
+            # Newlines never start a run (regex "." skips them)
+            prev = ch if ch != "\n" else None
+            run = 1
+    return mask, longest
+
+
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+
+def _fast_email_check(email: str) -> bool:
+    """
+    Structural check equivalent to
+    ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$ without the regex engine.
+    """
+    at = email.find("@")
+    if at <= 0 or email.find("@", at + 1) != -1:
+        return False
+    
+    local, domain = email[:at], email[at + 1:]
+    if not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+    if not _EMAIL_DOMAIN_CHARS.issuperset(domain):
+        return False
+    
+    # Needs a non-empty host part and an alphabetic TLD of 2+ chars
+    dot = domain.rfind(".")
+    if dot <= 0:
+        return False
+    tld = domain[dot + 1:]
+    return len(tld) >= 2 and _ASCII_LETTERS.issuperset(tld)
+
+
 class EmailValidator:
     """Email validation utilities."""
     
-    # Disposable email domains to reject
-    DISPOSABLE_DOMAINS = {
+    # Disposable email domains to reject (subdomains included)
+    DISPOSABLE_DOMAINS = frozenset({
         "tempmail.com", "throwaway.com", "mailinator.com", "guerrillamail.com",
         "10minutemail.com", "yopmail.com", "trashmail.com", "fakeinbox.com"
-    }
+    })
     
     @classmethod
     def is_disposable(cls, email: str) -> bool:
         """Check if email is from a disposable email service."""
         try:
-            domain = email.lower().split("@")[1]
-            return domain in cls.DISPOSABLE_DOMAINS
-        except (IndexError, AttributeError):
+            return cls._is_disposable_lower(email.lower())
+        except AttributeError:
             return False
     
+    @classmethod
+    def _is_disposable_lower(cls, email_lower: str) -> bool:
+        """is_disposable for an address that is already lowercased."""
+        try:
+            domain = email_lower.split("@")[1]
+        except IndexError:
+            return False
+        
+        # Walk labels from the TLD inward; any blocked suffix matches
+        node = _DISPOSABLE_TRIE
+        for label in reversed(domain.split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if _TRIE_END in node:
+                return True
+        return False
+    
     @classmethod
     def validate(cls, email: str) -> Tuple[bool, Optional[str]]:
         """
@@ -181,19 +287,82 @@ class EmailValidator:
         """
         if not email:
             return False, "Email is required"
-        
+        return cls._validate_lower(email, email.lower())
+    
+    @classmethod
+    def _validate_lower(cls, email: str, email_lower: str) -> Tuple[bool, Optional[str]]:
+        """validate() with the lowercased address computed by the caller."""
         # Basic format check
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, email):
+        if not _fast_email_check(email):
             return False, "Invalid email format"
         
         # Check for disposable email
-        if cls.is_disposable(email):
+        if cls._is_disposable_lower(email_lower):
             return False, "Disposable email addresses are not allowed"
         
         return True, None
 
 
+def _parse_indian_phone(phone: str) -> Tuple[bool, Optional[str]]:
+    """
+    Validate and normalize an Indian phone number in one pass.
+    
+    Returns:
+        Tuple of (is_valid, normalized). normalized is the +91XXXXXXXXXX
+        form whenever the digit count fits a known format, even if the
+        number itself is invalid; None otherwise.
+    """
+    digits = []
+    has_plus = False
+    clean = True  # only digits, separators and a leading +
+    for ch in phone:
+        if ch.isdecimal():
+            digits.append(ch)
+        elif ch in "-()" or ch.isspace():
+            continue
+        elif ch == "+" and not digits and not has_plus:
+            has_plus = True
+        else:
+            clean = False
+    
+    count = len(digits)
+    number = "".join(digits)
+    if count == 10:
+        normalized = "+91" + number
+    elif count == 12 and number.startswith("91"):
+        normalized = "+" + number
+    elif count == 11 and number.startswith("0"):
+        normalized = "+91" + number[1:]
+    else:
+        return False, None
+    
+    # Subscriber number must start with 6-9; "+" only with the 91 prefix
+    is_valid = (
+        clean
+        and normalized[3] in "6789"
+        and (not has_plus or count == 12)
+    )
+    return is_valid, normalized
+
+
+# Reversed-label trie over DISPOSABLE_DOMAINS:
+# "mailinator.com" -> {"com": {"mailinator": {_TRIE_END: True}}}
+_TRIE_END = "."  # can never be a label after splitting on "."
+
+
+def _build_domain_trie(domains) -> dict:
+    root = {}
+    for domain in domains:
+        node = root
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[_TRIE_END] = True
+    return root
+
+
+_DISPOSABLE_TRIE = _build_domain_trie(EmailValidator.DISPOSABLE_DOMAINS)
+
+
 class PhoneValidator:
     """Phone number validation utilities."""
     
@@ -204,6 +373,7 @@ class PhoneValidator:
         
         Accepts formats:
         - 9876543210
+        - 09876543210
         - +919876543210
         - 91-9876543210
         - +91-9876543210
@@ -211,19 +381,9 @@ class PhoneValidator:
         if not phone:
             return True, None  # Phone is optional
         
-        # Remove common separators
-        clean_phone = re.sub(r"[-\s()]", "", phone)
-        
-        # Check various Indian phone formats
-        patterns = [
-            r"^[6-9]\d{9}$",           # 10 digit starting with 6-9
-            r"^91[6-9]\d{9}$",         # With 91 prefix
-            r"^\+91[6-9]\d{9}$",       # With +91 prefix
-        ]
-        
-        for pattern in patterns:
-            if re.match(pattern, clean_phone):
-                return True, None
+        is_valid, _ = _parse_indian_phone(phone)
+        if is_valid:
+            return True, None
         
         return False, "Invalid Indian phone number format"
     
@@ -233,18 +393,9 @@ class PhoneValidator:
         if not phone:
             return phone
         
-        # Remove all non-digits
-        digits = re.sub(r"\D", "", phone)
+        _, normalized = _parse_indian_phone(phone)
         
-        # Handle various formats
-        if len(digits) == 10:
-            return f"+91{digits}"
-        elif len(digits) == 12 and digits.startswith("91"):
-            return f"+{digits}"
-        elif len(digits) == 11 and digits.startswith("0"):
-            return f"+91{digits[1:]}"
-        
-        return phone  # Return as-is if can't normalize
+        return normalized or phone  # Return as-is if can't normalize
 
 
 # ============================================================
@@ -261,10 +412,14 @@ def validate_password_strength(password: str) -> str:
 
 def validate_email_not_disposable(email: str) -> str:
     """Pydantic validator to reject disposable emails."""
-    is_valid, error = EmailValidator.validate(email)
+    if not email:
+        raise ValueError("Email is required")
+    
+    email_lower = email.lower()
+    is_valid, error = EmailValidator._validate_lower(email, email_lower)
     if not is_valid:
         raise ValueError(error)
-    return email.lower()
+    return email_lower
 
 
 def validate_indian_phone(phone: Optional[str]) -> Optional[str]:
@@ -272,8 +427,9 @@ def validate_indian_phone(phone: Optional[str]) -> Optional[str]:
     if not phone:
         return phone
     
-    is_valid, error = PhoneValidator.validate_indian(phone)
+    # Validate and normalize from the same scan
+    is_valid, normalized = _parse_indian_phone(phone)
     if not is_valid:
-        raise ValueError(error)
+        raise ValueError("Invalid Indian phone number format")
     
-    return PhoneValidator.normalize(phone)
+    return normalized
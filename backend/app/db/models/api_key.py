@@ -2,14 +2,30 @@
 api_key.py - API Key document model for database persistence
 """
 
-from beanie import Document, Indexed
-from pydantic import Field
-from typing import Optional
+from beanie import Document, Indexed, PydanticObjectId
+from pydantic import Field, field_validator
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from typing import Optional, Dict, Tuple
 from datetime import datetime
 from enum import Enum
+import hashlib
+import hmac
 import secrets
 
 
+# Pending usage per key: id -> (request count, last used at).
+# Flushed to MongoDB periodically instead of one save() per request.
+_usage_buffer: Dict[PydanticObjectId, Tuple[int, datetime]] = {}
+
+
+def _requeue_usage(pending: Dict[PydanticObjectId, Tuple[int, datetime]]):
+    """Merge unwritten usage back into the buffer (counts add, latest time wins)."""
+    for key_id, (count, last_used) in pending.items():
+        buffered_count, buffered_last_used = _usage_buffer.get(key_id, (0, last_used))
+        _usage_buffer[key_id] = (buffered_count + count, max(buffered_last_used, last_used))
+
+
 class APIKeyStatus(str, Enum):
     ACTIVE = "active"
     REVOKED = "revoked"
@@ -25,7 +41,7 @@ class APIKey(Document):
     
     # Key info
     key: str  # The actual API key (hashed prefix visible) - unique indexed
-    key_hash: str  # SHA256 hash of the full key for verification
+    key_hash: bytes  # Raw SHA256 digest of the full key for verification
     name: str = "Default API Key"  # User-friendly name
     
     # Status
@@ -61,28 +77,37 @@ class APIKey(Document):
             }
         }
     
+    @field_validator("key_hash", mode="before")
+    @classmethod
+    def decode_legacy_hex(cls, v):
+        """Older documents stored the hash as a hex string."""
+        if isinstance(v, str):
+            return bytes.fromhex(v)
+        return v
+    
     @staticmethod
-    def generate_key() -> tuple[str, str]:
+    def generate_key() -> tuple[str, bytes]:
         """
         Generate a new API key and its hash.
         Returns: (visible_key, key_hash)
         """
-        import hashlib
-        
         # Generate a secure random key
-        random_bytes = secrets.token_bytes(32)
         key = f"sk_live_{secrets.token_urlsafe(32)}"
         
-        # Create hash for storage
-        key_hash = hashlib.sha256(key.encode()).hexdigest()
-        
-        return key, key_hash
+        return key, APIKey.hash_key(key)
     
     @staticmethod
-    def hash_key(key: str) -> str:
-        """Hash an API key for comparison."""
-        import hashlib
-        return hashlib.sha256(key.encode()).hexdigest()
+    def hash_key(key: str) -> bytes:
+        """
+        Hash an API key for comparison.
+        Raw digest - skips hex formatting; OpenSSL uses SHA-NI when present.
+        """
+        return hashlib.sha256(key.encode("utf-8")).digest()
+    
+    @staticmethod
+    def verify(incoming_key: str, stored_hash: bytes) -> bool:
+        """Constant-time check of a raw key against a stored digest."""
+        return hmac.compare_digest(APIKey.hash_key(incoming_key), stored_hash)
     
     def is_valid(self) -> bool:
         """Check if the API key is valid for use."""
@@ -95,7 +120,47 @@ class APIKey(Document):
         return True
     
     async def record_usage(self):
-        """Record that this API key was used."""
-        self.last_used_at = datetime.utcnow()
+        """
+        Record that this API key was used.
+        Buffered in memory; persisted by flush_usage().
+        """
+        now = datetime.utcnow()
+        self.last_used_at = now
         self.total_requests += 1
-        await self.save()
+        
+        count, _ = _usage_buffer.get(self.id, (0, now))
+        _usage_buffer[self.id] = (count + 1, now)
+    
+    @classmethod
+    async def flush_usage(cls) -> int:
+        """
+        Write buffered usage counters in one bulk write.
+        Returns the number of keys updated.
+        """
+        if not _usage_buffer:
+            return 0
+        
+        # Swap the buffer out before awaiting so new usage goes to a fresh one
+        pending = dict(_usage_buffer)
+        _usage_buffer.clear()
+        
+        key_ids = list(pending)
+        operations = [
+            UpdateOne(
+                {"_id": key_id},
+                {"$inc": {"total_requests": count}, "$set": {"last_used_at": last_used}}
+            )
+            for key_id, (count, last_used) in pending.items()
+        ]
+        try:
+            await cls.get_motor_collection().bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            # Unordered: everything but the reported operations was applied
+            failed = {key_ids[error["index"]] for error in e.details.get("writeErrors", [])}
+            _requeue_usage({key_id: pending[key_id] for key_id in failed})
+            raise
+        except Exception:
+            # Nothing known to be written - keep it all for the next flush
+            _requeue_usage(pending)
+            raise
+        return len(operations)
@@ -0,0 +1,67 @@
+"""
+bulk.py - Batched inserts for write-heavy documents and idempotent
+upserts for seeded ones
+"""
+
+from typing import Sequence, Tuple
+
+from beanie import PydanticObjectId
+from pymongo import UpdateOne, WriteConcern
+
+
+# Acknowledged writes: batching is for throughput, not for dropping durability
+_ACKNOWLEDGED = WriteConcern(w=1)
+
+
+def _raw_document(document) -> dict:
+    """Dump a (validated) document once, with a client-side _id."""
+    if document.id is None:
+        document.id = PydanticObjectId()
+    doc = document.model_dump(by_alias=True, exclude={"id", "revision_id"})
+    doc["_id"] = document.id
+    return doc
+
+
+class BulkInsertMixin:
+    """
+    Adds bulk_insert() and bulk_upsert_raw() to a Beanie Document.
+    Mix in before Document: class ScanRequest(BulkInsertMixin, Document)
+    """
+    
+    @classmethod
+    async def bulk_insert(cls, documents: Sequence, batch_size: int = 1000) -> int:
+        """
+        Insert documents with one unordered insert_many per batch_size docs,
+        instead of one round trip per insert().
+        Each document is dumped once and handed to the Motor collection as a
+        plain dict - no Beanie actions/hooks run. Ids are assigned client-side
+        and set on the documents. Returns the number inserted.
+        """
+        collection = cls.get_motor_collection().with_options(write_concern=_ACKNOWLEDGED)
+        inserted = 0
+        for start in range(0, len(documents), batch_size):
+            docs = [_raw_document(document) for document in documents[start:start + batch_size]]
+            result = await collection.insert_many(docs, ordered=False)
+            inserted += len(result.inserted_ids)
+        return inserted
+    
+    @classmethod
+    async def bulk_upsert_raw(cls, documents: Sequence, key: Tuple[str, ...]) -> int:
+        """
+        Idempotent seeding: one unordered bulk_write of
+        UpdateOne({key fields}, {"$setOnInsert": doc}, upsert=True) per document.
+        Documents already present (matched on key) are left untouched.
+        Each (already validated) document is dumped once and handed to the
+        Motor collection as a plain dict - no Beanie actions/hooks run.
+        Returns the number inserted. Ids are assigned client-side, so they are
+        only correct on the documents that were actually inserted.
+        """
+        ops = []
+        for document in documents:
+            doc = _raw_document(document)
+            ops.append(UpdateOne({field: doc[field] for field in key}, {"$setOnInsert": doc}, upsert=True))
+        if not ops:
+            return 0
+        collection = cls.get_motor_collection().with_options(write_concern=_ACKNOWLEDGED)
+        result = await collection.bulk_write(ops, ordered=False)
+        return result.upserted_count
@@ -2,12 +2,34 @@
 scammer.py - Scammer fingerprint document
 """
 
+import bisect
+
 from beanie import Document, Indexed
-from pydantic import Field
-from typing import Optional, List, Dict, Any, Annotated
+from pydantic import Field, PrivateAttr
+from typing import Optional, List, Dict, Set, Any, Annotated
 from datetime import datetime
 
 
+# Identifier type -> list field holding its values
+_IDENTIFIER_FIELDS = {
+    "phone": "phone_numbers",
+    "email": "email_addresses",
+    "bank": "bank_accounts",
+    "upi": "upi_ids",
+    "crypto": "crypto_wallets",
+}
+
+# Risk score lower bounds -> threat level, ascending
+_THREAT_LEVELS = (
+    (float("-inf"), "low"),
+    (0.3, "medium"),
+    (0.6, "high"),
+    (0.8, "critical"),
+)
+_THREAT_THRESHOLDS = [threshold for threshold, _ in _THREAT_LEVELS]
+_THREAT_LABELS = [label for _, label in _THREAT_LEVELS]
+
+
 class ScammerFingerprint(Document):
     """
     Known scammer fingerprint for tracking repeat offenders.
@@ -42,11 +64,20 @@ class ScammerFingerprint(Document):
     reported_to: List[str] = Field(default_factory=list)  # Authorities notified
     notes: List[str] = Field(default_factory=list)
     
+    # In-memory set mirrors of the identifier lists (not persisted)
+    _identifier_sets: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+    
     class Settings:
         name = "scammer_fingerprints"
         indexes = [
             [("risk_score", -1)],
             [("last_seen", -1)],
+            # Multikey indexes so find_by_identifier's $or uses index unions
+            [("phone_numbers", 1)],
+            [("email_addresses", 1)],
+            [("bank_accounts", 1)],
+            [("upi_ids", 1)],
+            [("crypto_wallets", 1)],
         ]
     
     def add_session(self, session_id: str):
@@ -62,27 +93,24 @@ class ScammerFingerprint(Document):
     
     def add_identifier(self, id_type: str, value: str):
         """Add an identifier to the fingerprint"""
-        id_map = {
-            "phone": self.phone_numbers,
-            "email": self.email_addresses,
-            "bank": self.bank_accounts,
-            "upi": self.upi_ids,
-            "crypto": self.crypto_wallets,
-        }
+        field_name = _IDENTIFIER_FIELDS.get(id_type)
+        if field_name is None:
+            return
+        
+        values = getattr(self, field_name)
+        seen = self._identifier_sets.get(id_type)
+        if seen is None or len(seen) != len(values):
+            # Built lazily; rebuilt if the list was changed directly
+            seen = self._identifier_sets[id_type] = set(values)
         
-        if id_type in id_map and value not in id_map[id_type]:
-            id_map[id_type].append(value)
+        if value not in seen:
+            seen.add(value)
+            values.append(value)
     
     def _update_threat_level(self):
         """Update threat level based on risk score"""
-        if self.risk_score >= 0.8:
-            self.threat_level = "critical"
-        elif self.risk_score >= 0.6:
-            self.threat_level = "high"
-        elif self.risk_score >= 0.3:
-            self.threat_level = "medium"
-        else:
-            self.threat_level = "low"
+        index = bisect.bisect_right(_THREAT_THRESHOLDS, self.risk_score) - 1
+        self.threat_level = _THREAT_LABELS[index]
     
     @classmethod
     async def find_by_identifier(cls, value: str) -> Optional["ScammerFingerprint"]:
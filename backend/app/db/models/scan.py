@@ -2,12 +2,14 @@
 scan.py - Scan request document
 """
 
-from beanie import Document, Indexed
-from pydantic import Field
-from typing import Optional, Dict, Any, List, Annotated
+from beanie import Document
+from pydantic import Field, PrivateAttr
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from enum import Enum
 
+from app.db.models.bulk import BulkInsertMixin
+
 
 class Channel(str, Enum):
     SMS = "SMS"
@@ -17,11 +19,11 @@ class Channel(str, Enum):
     OTHER = "Other"
 
 
-class ScanRequest(Document):
+class ScanRequest(BulkInsertMixin, Document):
     """
     Record of a message scan request and result.
     """
-    user_id: Annotated[str, Indexed()]  # References User._id
+    user_id: str  # References User._id - (user_id, created_at) index covers lookups
     
     # Input
     message_text: str
@@ -50,6 +52,9 @@ class ScanRequest(Document):
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
+    # Lazily computed (max_length, preview) pair (not persisted)
+    _preview_cache: Optional[Tuple[int, str]] = PrivateAttr(default=None)
+    
     class Settings:
         name = "scan_requests"
         indexes = [
@@ -69,7 +74,13 @@ class ScanRequest(Document):
         }
     
     def get_preview(self, max_length: int = 100) -> str:
-        """Get truncated preview of message"""
+        """Get truncated preview of message (computed once per length)"""
+        cached = self._preview_cache
+        if cached is not None and cached[0] == max_length:
+            return cached[1]
         if len(self.message_text) <= max_length:
-            return self.message_text
-        return self.message_text[:max_length] + "..."
+            preview = self.message_text
+        else:
+            preview = self.message_text[:max_length] + "..."
+        self._preview_cache = (max_length, preview)
+        return preview
@@ -3,11 +3,21 @@ session.py - Honeypot session document (migrated from in-memory)
 """
 
 from beanie import Document, Indexed
-from pydantic import Field
-from typing import Optional, List, Dict, Any, Annotated
+from pydantic import Field, PrivateAttr, field_validator
+from typing import Optional, List, Dict, Set, Any, Annotated
 from datetime import datetime
 from enum import Enum
 
+from app.db.models.bulk import BulkInsertMixin
+
+
+# Column names for HoneypotSession.messages
+MESSAGE_COLUMNS = ("sender", "text", "timestamp", "metadata")
+
+
+def _empty_message_columns() -> Dict[str, List[Any]]:
+    return {column: [] for column in MESSAGE_COLUMNS}
+
 
 class SessionStatus(str, Enum):
     ACTIVE = "active"
@@ -40,10 +50,10 @@ class ExtractedIntel(Document):
     
     def has_intel(self) -> bool:
         """Check if any intel has been extracted"""
-        return any([
-            self.phones, self.emails, self.bank_accounts,
-            self.upi_ids, self.names, self.urls, self.crypto_wallets
-        ])
+        return bool(
+            self.phones or self.emails or self.bank_accounts
+            or self.upi_ids or self.names or self.urls or self.crypto_wallets
+        )
     
     def to_dict(self) -> Dict[str, List[str]]:
         return {
@@ -57,7 +67,7 @@ class ExtractedIntel(Document):
         }
 
 
-class HoneypotSession(Document):
+class HoneypotSession(BulkInsertMixin, Document):
     """
     Honeypot engagement session with scammer.
     Replaces the in-memory session_manager.
@@ -71,9 +81,9 @@ class HoneypotSession(Document):
     # Status
     status: SessionStatus = SessionStatus.ACTIVE
     
-    # Conversation
-    messages: List[Dict[str, Any]] = Field(default_factory=list)
-    # Each message: {"sender": str, "text": str, "timestamp": str, "metadata": {}}
+    # Conversation, stored column-wise: one parallel list per field
+    messages: Dict[str, List[Any]] = Field(default_factory=_empty_message_columns)
+    # {"sender": [str], "text": [str], "timestamp": [str], "metadata": [{}]}
     
     # Extracted intelligence
     intel: Dict[str, List[str]] = Field(default_factory=lambda: {
@@ -112,6 +122,9 @@ class HoneypotSession(Document):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     closed_at: Optional[datetime] = None
     
+    # In-memory set mirrors of the intel lists (not persisted)
+    _intel_sets: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+    
     class Settings:
         name = "honeypot_sessions"
         indexes = [
@@ -119,21 +132,43 @@ class HoneypotSession(Document):
             [("scam_type", 1)],
         ]
     
+    @field_validator("messages", mode="before")
+    @classmethod
+    def messages_to_columns(cls, v):
+        """Accept the older list-of-dicts shape and convert it to columns."""
+        if isinstance(v, list):
+            columns = _empty_message_columns()
+            for msg in v:
+                columns["sender"].append(msg.get("sender"))
+                columns["text"].append(msg.get("text"))
+                columns["timestamp"].append(msg.get("timestamp"))
+                columns["metadata"].append(msg.get("metadata") or {})
+            return columns
+        return v
+    
     @property
     def message_count(self) -> int:
-        return len(self.messages)
+        return len(self.messages["sender"])
+    
+    @property
+    def message_list(self) -> List[Dict[str, Any]]:
+        """Messages as a list of dicts (the API response shape)."""
+        return [
+            {"sender": s, "text": t, "timestamp": ts, "metadata": m}
+            for s, t, ts, m in zip(*(self.messages[c] for c in MESSAGE_COLUMNS))
+        ]
     
     def add_message(self, sender: str, text: str, timestamp: str = None, metadata: dict = None):
         """Add a message to conversation history"""
+        now = datetime.utcnow()
         if timestamp is None:
-            timestamp = datetime.utcnow().isoformat() + "Z"
+            timestamp = now.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
         
-        self.messages.append({
-            "sender": sender,
-            "text": text,
-            "timestamp": timestamp,
-            "metadata": metadata or {}
-        })
+        messages = self.messages
+        messages["sender"].append(sender)
+        messages["text"].append(text)
+        messages["timestamp"].append(timestamp)
+        messages["metadata"].append(metadata or {})
         
         self.total_messages += 1
         if sender == "scammer":
@@ -141,33 +176,91 @@ class HoneypotSession(Document):
         else:
             self.agent_messages += 1
             
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
+    
+    @classmethod
+    async def append_messages(cls, session_id: str, messages: List[Dict[str, Any]]) -> None:
+        """
+        Append a burst of messages with one $push/$each update, instead of
+        re-sending the whole conversation through save().
+        
+        Each message: {"sender": str, "text": str, "timestamp"?: str, "metadata"?: {}}
+        """
+        if not messages:
+            return
+        
+        now = datetime.utcnow()
+        default_timestamp = now.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        scammer_count = sum(1 for m in messages if m["sender"] == "scammer")
+        
+        # Only column-shaped documents can take the $push - sessions still
+        # stored as a list of message dicts would fail the update server-side.
+        # (Not "messages.sender" $exists: dot paths also match inside arrays)
+        result = await cls.get_motor_collection().update_one(
+            {"session_id": session_id, "messages": {"$not": {"$type": "array"}}},
+            {
+                "$push": {
+                    "messages.sender": {"$each": [m["sender"] for m in messages]},
+                    "messages.text": {"$each": [m["text"] for m in messages]},
+                    "messages.timestamp": {
+                        "$each": [m.get("timestamp") or default_timestamp for m in messages]
+                    },
+                    "messages.metadata": {"$each": [m.get("metadata") or {} for m in messages]},
+                },
+                "$inc": {
+                    "total_messages": len(messages),
+                    "scammer_messages": scammer_count,
+                    "agent_messages": len(messages) - scammer_count,
+                },
+                "$set": {"updated_at": now},
+            }
+        )
+        if result.matched_count:
+            return
+        
+        # Legacy list shape (or no such session): load through the validator,
+        # which converts to columns, and save - this migrates the document
+        session = await cls.find_one({"session_id": session_id})
+        if session is None:
+            return
+        for m in messages:
+            session.add_message(m["sender"], m["text"], m.get("timestamp"), m.get("metadata"))
+        await session.save()
     
     def get_history_for_prompt(self, max_messages: int = 20) -> str:
         """Format conversation for LLM prompt"""
-        recent = self.messages[-max_messages:]
-        
-        formatted = []
-        for msg in recent:
-            role = "Scammer" if msg["sender"] == "scammer" else "You"
-            formatted.append(f"{role}: {msg['text']}")
+        senders = self.messages["sender"][-max_messages:]
+        texts = self.messages["text"][-max_messages:]
         
-        return "\n".join(formatted)
+        return "\n".join(
+            f"{'Scammer' if sender == 'scammer' else 'You'}: {text}"
+            for sender, text in zip(senders, texts)
+        )
     
     def add_intel(self, intel_type: str, value: str):
         """Add extracted intelligence"""
-        if intel_type in self.intel:
-            if value not in self.intel[intel_type]:
-                self.intel[intel_type].append(value)
+        values = self.intel.get(intel_type)
+        if values is None:
+            return
+        
+        seen = self._intel_sets.get(intel_type)
+        if seen is None or len(seen) != len(values):
+            # Built lazily; rebuilt if the list was changed directly
+            seen = self._intel_sets[intel_type] = set(values)
+        
+        if value not in seen:
+            seen.add(value)
+            values.append(value)
     
     async def close_session(self):
         """Close the session"""
+        now = datetime.utcnow()
         self.status = SessionStatus.CLOSED
-        self.closed_at = datetime.utcnow()
+        self.closed_at = now
         
         # Calculate engagement duration
         if self.created_at:
-            delta = datetime.utcnow() - self.created_at
+            delta = now - self.created_at
             self.engagement_duration_seconds = int(delta.total_seconds())
         
         await self.save()
@@ -8,6 +8,8 @@ from typing import Optional, List, Dict, Any, Annotated
 from datetime import datetime
 from enum import Enum
 
+from app.db.models.bulk import BulkInsertMixin
+
 
 class PlanTier(str, Enum):
     FREE = "free"
@@ -22,7 +24,7 @@ class SubscriptionStatus(str, Enum):
     TRIAL = "trial"
 
 
-class Plan(Document):
+class Plan(BulkInsertMixin, Document):
     """
     Available subscription plans.
     """
@@ -88,7 +90,10 @@ class Subscription(Document):
     
     class Settings:
         name = "subscriptions"
-        
+        indexes = [
+            [("user_id", 1), ("last_scan_date", -1)],
+        ]
+    
     def is_valid(self) -> bool:
         """Check if subscription is currently valid"""
         if self.status != SubscriptionStatus.ACTIVE:
@@ -99,18 +104,19 @@ class Subscription(Document):
     
     async def increment_scan_count(self):
         """Increment scan counters"""
-        today = datetime.utcnow().date()
+        now = datetime.utcnow()
+        last = self.last_scan_date
         
-        # Reset daily count if new day
-        if self.last_scan_date and self.last_scan_date.date() != today:
-            self.scans_today = 0
+        if last:
+            # Reset daily count if new day
+            if last.toordinal() != now.toordinal():
+                self.scans_today = 0
             
-        # Reset monthly count if new month
-        if self.last_scan_date:
-            if self.last_scan_date.month != datetime.utcnow().month:
+            # Reset monthly count if new month (year-aware month index)
+            if last.year * 12 + last.month != now.year * 12 + now.month:
                 self.scans_this_month = 0
         
         self.scans_today += 1
         self.scans_this_month += 1
-        self.last_scan_date = datetime.utcnow()
+        self.last_scan_date = now
         await self.save()
@@ -2,12 +2,14 @@
 threat.py - Blocked threat document
 """
 
-from beanie import Document, Indexed
+from beanie import Document
 from pydantic import Field
-from typing import Optional, Annotated
+from typing import Optional
 from datetime import datetime
 from enum import Enum
 
+from app.db.models.bulk import BulkInsertMixin
+
 
 class ThreatStatus(str, Enum):
     BLOCKED = "blocked"
@@ -26,11 +28,11 @@ class ThreatType(str, Enum):
     OTHER = "other"
 
 
-class BlockedThreat(Document):
+class BlockedThreat(BulkInsertMixin, Document):
     """
     Record of a blocked threat/scam attempt.
     """
-    user_id: Annotated[str, Indexed()]  # References User._id
+    user_id: str  # References User._id - indexed via the compound indexes below
     scan_id: Optional[str] = None  # References ScanRequest._id if from scan
     
     # Threat info
@@ -56,8 +58,12 @@ class BlockedThreat(Document):
     
     class Settings:
         name = "blocked_threats"
+        # Equality fields first, then the blocked_at sort key. Every index
+        # leads with user_id, so no standalone user_id index is needed.
         indexes = [
             [("user_id", 1), ("blocked_at", -1)],
+            [("user_id", 1), ("status", 1), ("blocked_at", -1)],  # Status-filtered lists/counts
+            [("user_id", 1), ("threat_type", 1), ("blocked_at", -1)],  # Type-filtered lists
             [("threat_type", 1)],
         ]
         
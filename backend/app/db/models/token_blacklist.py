@@ -4,6 +4,7 @@ token_blacklist.py - Blacklisted JWT tokens for logout
 
 from beanie import Document, Indexed
 from pydantic import Field
+from pymongo import IndexModel
 from typing import Annotated
 from datetime import datetime
 
@@ -11,7 +12,8 @@ from datetime import datetime
 class TokenBlacklist(Document):
     """
     Blacklisted tokens (for logout functionality).
-    Tokens are stored until their expiry time.
+    Tokens are stored until their expiry time; a TTL index on expires_at
+    lets MongoDB delete them automatically.
     """
     token: Annotated[str, Indexed(unique=True)]
     expires_at: datetime
@@ -19,6 +21,9 @@ class TokenBlacklist(Document):
     
     class Settings:
         name = "token_blacklist"
+        indexes = [
+            IndexModel([("expires_at", 1)], expireAfterSeconds=0),
+        ]
         
     @classmethod
     async def is_blacklisted(cls, token: str) -> bool:
@@ -34,5 +39,8 @@ class TokenBlacklist(Document):
     
     @classmethod
     async def cleanup_expired(cls):
-        """Remove expired tokens from blacklist"""
+        """
+        Remove expired tokens from blacklist.
+        Normally a no-op - the TTL index expires entries server-side.
+        """
         await cls.find(cls.expires_at < datetime.utcnow()).delete()
@@ -2,13 +2,16 @@
 user.py - User document model
 """
 
-from beanie import Document
-from pydantic import EmailStr, Field
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, EmailStr, Field
+from pymongo import IndexModel
 from typing import Optional, Annotated
 from datetime import datetime
 from enum import Enum
 from beanie import Indexed
 
+from app.db.models.subscription import PlanTier
+
 
 class UserRole(str, Enum):
     USER = "user"
@@ -41,6 +44,10 @@ class User(Document):
     is_verified: bool = False  # Email verified
     is_phone_verified: bool = False  # Phone verified
     
+    # Denormalized from the active Subscription so tier checks skip a query.
+    # None = not synced yet (documents created before this field existed)
+    active_tier: Optional[PlanTier] = None
+    
     # Email verification
     verification_token: Optional[str] = None
     verification_token_expires: Optional[datetime] = None
@@ -63,6 +70,24 @@ class User(Document):
     
     class Settings:
         name = "users"
+        # Token fields hold null for most users; {"$gt": ""} keeps nulls out
+        # of the partial indexes while equality lookups on a token still
+        # satisfy the filter, so the planner can use them.
+        # No TTL on the *_expires fields: a TTL index deletes the whole
+        # user document, not the token. Expired tokens are cleared when used.
+        indexes = [
+            # Named explicitly - the default names belong to the plain legacy
+            # indexes, which app.db.mongodb.drop_legacy_indexes removes
+            IndexModel([("verification_token", 1)],
+                       name="verification_token_partial",
+                       partialFilterExpression={"verification_token": {"$gt": ""}}),
+            IndexModel([("reset_token", 1)],
+                       name="reset_token_partial",
+                       partialFilterExpression={"reset_token": {"$gt": ""}}),
+            IndexModel([("oauth_id", 1), ("auth_provider", 1)],
+                       partialFilterExpression={"oauth_id": {"$gt": ""}}),
+            IndexModel([("role", 1), ("is_active", 1)]),
+        ]
         
     class Config:
         json_schema_extra = {
@@ -84,3 +109,28 @@ class User(Document):
         self.is_active = False
         self.update_timestamp()
         await self.save()
+
+
+# ============================================================
+# Projections - fetch only what a hot path reads
+# Usage: await User.find_one(...).project(ActiveUserView)
+# ============================================================
+
+class ActiveUserView(BaseModel):
+    """Token refresh: does the user exist and is it active."""
+    id: PydanticObjectId = Field(alias="_id")
+    is_active: bool = True
+
+
+class ResetTokenView(BaseModel):
+    """Password reset: which user holds the token, and until when."""
+    id: PydanticObjectId = Field(alias="_id")
+    reset_token_expires: Optional[datetime] = None
+
+
+class VerificationStatusView(BaseModel):
+    """Email/phone verification flags."""
+    email: str
+    phone: Optional[str] = None
+    is_verified: bool = False
+    is_phone_verified: bool = False
@@ -3,6 +3,7 @@ user_settings.py - User settings/preferences document
 """
 
 from beanie import Document, Indexed, Link
+from cachetools import TTLCache
 from pydantic import Field
 from typing import Optional, Annotated
 from datetime import datetime
@@ -15,6 +16,11 @@ class SensitivityLevel(str, Enum):
     HIGH = "high"
 
 
+# Per-process cache of settings by user_id. Settings change rarely; other
+# workers may serve a stale copy for up to the TTL after an update.
+_SETTINGS_CACHE: TTLCache = TTLCache(maxsize=50_000, ttl=60)
+
+
 class UserSettings(Document):
     """
     User preferences and notification settings.
@@ -47,9 +53,26 @@ class UserSettings(Document):
         
     @classmethod
     async def get_or_create(cls, user_id: str) -> "UserSettings":
-        """Get existing settings or create defaults"""
+        """Get existing settings or create defaults (cached per process)"""
+        settings = _SETTINGS_CACHE.get(user_id)
+        if settings is not None:
+            return settings
+        
         settings = await cls.find_one(cls.user_id == user_id)
         if not settings:
             settings = cls(user_id=user_id)
             await settings.insert()
+        return cls.cache(settings)
+    
+    @staticmethod
+    def cache(settings: "UserSettings") -> "UserSettings":
+        """
+        Cache settings unless a newer copy is already cached - a read that
+        raced an update must not replace the saved document with its older one.
+        Returns whichever copy is cached.
+        """
+        cached = _SETTINGS_CACHE.get(settings.user_id)
+        if cached is not None and cached.updated_at > settings.updated_at:
+            return cached
+        _SETTINGS_CACHE[settings.user_id] = settings
         return settings
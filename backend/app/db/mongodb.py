@@ -8,12 +8,35 @@ It provides a clean, Pythonic way to interact with MongoDB.
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
 from typing import Optional
+import asyncio
 import os
 
 # Will be populated on startup
 client: Optional[AsyncIOMotorClient] = None
 database = None
 
+# Plain indexes older init_db runs created, since replaced by partial ones
+# declared on the models. Same key pattern, so they must go before Beanie
+# creates the new ones: collection -> index names
+LEGACY_INDEXES = {
+    "users": ("verification_token_1", "reset_token_1"),
+}
+
+
+async def drop_legacy_indexes(db):
+    """
+    Drop the superseded non-partial indexes, if present.
+    Safe to run on every startup - a no-op once they are gone.
+    """
+    for collection_name, index_names in LEGACY_INDEXES.items():
+        collection = db[collection_name]
+        existing = await collection.index_information()
+        for index_name in index_names:
+            info = existing.get(index_name)
+            if info is not None and "partialFilterExpression" not in info:
+                await collection.drop_index(index_name)
+                print(f"[DB] Dropped legacy index {collection_name}.{index_name}")
+
 
 async def connect_to_mongodb():
     """
@@ -27,9 +50,22 @@ async def connect_to_mongodb():
     
     print(f"[DB] Connecting to MongoDB...")
     
-    client = AsyncIOMotorClient(mongodb_url)
+    min_pool = int(os.getenv("MONGO_POOL_MIN", "20"))
+    client = AsyncIOMotorClient(
+        mongodb_url,
+        maxPoolSize=int(os.getenv("MONGO_POOL_MAX", "200")),
+        minPoolSize=min_pool,
+        maxIdleTimeMS=60000,
+        compressors=os.getenv("MONGO_COMPRESSORS", "zstd,zlib"),
+        retryWrites=True,
+        serverSelectionTimeoutMS=3000,
+        waitQueueTimeoutMS=2000,
+    )
     database = client[db_name]
     
+    # Warm the pool so the first requests don't pay for connection setup
+    await asyncio.gather(*(client.admin.command("ping") for _ in range(min_pool)))
+    
     # Import all document models
     from app.db.models.user import User
     from app.db.models.user_settings import UserSettings
@@ -41,6 +77,9 @@ async def connect_to_mongodb():
     from app.db.models.token_blacklist import TokenBlacklist
     from app.db.models.api_key import APIKey
     
+    # Legacy indexes would clash with the ones init_beanie creates
+    await drop_legacy_indexes(database)
+    
     # Initialize Beanie with all document models
     await init_beanie(
         database=database,
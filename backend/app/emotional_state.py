@@ -14,10 +14,21 @@ states:
 - PANICKED: extreme fear/urgency
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Optional
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 import random
+import re
+import threading
+
+from cachetools import LRUCache
+
+try:
+    import ahocorasick
+except ImportError:  # optional: fall back to per-keyword substring checks
+    ahocorasick = None
 
 
 class EmotionalState(Enum):
@@ -30,8 +41,8 @@ class EmotionalState(Enum):
     PANICKED = "panicked"
 
 
-# state transition probabilities based on scammer tactics
-STATE_TRANSITIONS = {
+# state transition probabilities based on scammer tactics (read-only)
+STATE_TRANSITIONS = MappingProxyType({
     EmotionalState.CONFUSED: {
         "threat": (EmotionalState.SCARED, 0.7),
         "urgency": (EmotionalState.CONCERNED, 0.6),
@@ -75,102 +86,118 @@ STATE_TRANSITIONS = {
         "help": (EmotionalState.COMPLIANT, 0.5),
         "default": (EmotionalState.PANICKED, 0.5),
     },
-}
+})
 
-# emotional response templates
-EMOTIONAL_RESPONSES = {
+# emotional response templates (read-only)
+EMOTIONAL_RESPONSES = MappingProxyType({
     EmotionalState.CONFUSED: {
-        "en": [
+        "en": (
             "Wait, I don't understand... can you explain again?",
             "Sorry, what are you saying? I'm confused.",
             "I don't get it... what should I do?",
             "Huh? What is happening? Please explain slowly.",
-        ],
-        "hi": [
+        ),
+        "hi": (
             "रुकिए, मुझे समझ नहीं आया... फिर से बताइए?",
             "माफ कीजिए, आप क्या कह रहे हैं? मुझे confusion हो रहा है",
             "मुझे समझ नहीं आ रहा... क्या करना है?",
-        ],
+        ),
     },
     EmotionalState.CONCERNED: {
-        "en": [
+        "en": (
             "Oh no, is there really a problem? What happened?",
             "This is concerning... what should I do?",
             "I'm worried now... please tell me more.",
             "Is this serious? What's wrong with my account?",
-        ],
-        "hi": [
+        ),
+        "hi": (
             "अरे नहीं, सच में कोई problem है? क्या हुआ?",
             "मुझे चिंता हो रही है... क्या करना चाहिए?",
             "ये serious है क्या? मेरे account में क्या गड़बड़ है?",
-        ],
+        ),
     },
     EmotionalState.SCARED: {
-        "en": [
+        "en": (
             "Oh my god! Please don't block my account! I'll do anything!",
             "Please sir, I'm scared! What do I do?",
             "I don't want any trouble! Please help me!",
             "I'm very worried now... please tell me what to do!",
-        ],
-        "hi": [
+        ),
+        "hi": (
             "भगवान! प्लीज मेरा account block मत करिए! मैं कुछ भी करूंगा!",
             "सर प्लीज, मुझे डर लग रहा है! क्या करूं?",
             "मुझे कोई problem नहीं चाहिए! प्लीज मदद करिए!",
-        ],
+        ),
     },
     EmotionalState.COMPLIANT: {
-        "en": [
+        "en": (
             "Okay okay, I'll do whatever you say. Just tell me.",
             "Yes sir, I'm ready to help. What do you need?",
             "Fine, I trust you. Tell me what to do.",
             "Alright, I'll cooperate. Please guide me.",
-        ],
-        "hi": [
+        ),
+        "hi": (
             "ठीक है ठीक है, आप जो कहो मैं करूंगा। बस बताइए।",
             "हाँ सर, मैं तैयार हूं। क्या चाहिए आपको?",
             "चलिए, मुझे भरोसा है। बताइए क्या करना है।",
-        ],
+        ),
     },
     EmotionalState.HESITANT: {
-        "en": [
+        "en": (
             "Wait, are you sure about this? Let me think...",
             "I'm not sure... maybe I should check with someone first.",
             "Hmm, something doesn't feel right... can you verify again?",
             "Hold on, let me just confirm this with my bank first.",
-        ],
-        "hi": [
+        ),
+        "hi": (
             "रुकिए, आप sure हैं? मुझे सोचने दीजिए...",
             "मुझे पक्का नहीं है... शायद पहले किसी से पूछ लूं।",
             "हम्म, कुछ ठीक नहीं लग रहा... फिर से verify करिए?",
-        ],
+        ),
     },
     EmotionalState.SUSPICIOUS: {
-        "en": [
+        "en": (
             "Wait a minute... how do I know you're really from the bank?",
             "Something is fishy here... can you give me your employee ID?",
             "I think I should call my bank directly to verify this.",
             "Why are you asking for OTP? Bank never asks for OTP on call.",
-        ],
-        "hi": [
+        ),
+        "hi": (
             "एक मिनट... मुझे कैसे पता आप सच में बैंक से हैं?",
             "कुछ गड़बड़ लग रहा है... अपना employee ID दीजिए?",
             "मुझे लगता है मैं bank को directly call करके verify करूं।",
-        ],
+        ),
     },
     EmotionalState.PANICKED: {
-        "en": [
+        "en": (
             "OH NO OH NO! Please don't do anything! I'll send immediately!",
             "Please please please! Don't arrest me! I'll do everything!",
             "I'm so scared! Just tell me quickly what to do!",
             "My hands are shaking! Please help me fix this NOW!",
-        ],
-        "hi": [
+        ),
+        "hi": (
             "अरे बाप रे! प्लीज कुछ मत करिए! मैं अभी भेजता हूं!",
             "प्लीज प्लीज! मुझे arrest मत करिए! सब करूंगा!",
             "मुझे बहुत डर लग रहा है! जल्दी बताइए क्या करना है!",
-        ],
+        ),
     },
-}
+})
+
+# prompt modifier per state (see EmotionalContext.get_state_modifier)
+_STATE_MODIFIERS = MappingProxyType({
+    EmotionalState.CONFUSED: "You are confused and don't understand what's happening.",
+    EmotionalState.CONCERNED: "You are concerned and worried about the situation.",
+    EmotionalState.SCARED: "You are scared and afraid of the consequences.",
+    EmotionalState.COMPLIANT: "You are willing to help and follow instructions.",
+    EmotionalState.HESITANT: "You are having second thoughts and are unsure.",
+    EmotionalState.SUSPICIOUS: "You are becoming suspicious and asking questions.",
+    EmotionalState.PANICKED: "You are in a state of panic and will do anything.",
+})
+
+
+# memory caps: live sessions kept, and states remembered per session
+MAX_SESSIONS = 100_000
+STATE_HISTORY_LIMIT = 64
 
 # scammer tactic detection keywords
 TACTIC_KEYWORDS = {
@@ -188,42 +215,123 @@ TACTIC_KEYWORDS = {
              "मदद", "सहायता"],
 }
 
+# normalized once: lowercase keyword tuples, read-only
+TACTIC_KEYWORDS = MappingProxyType({
+    tactic: tuple(kw.lower() for kw in keywords)
+    for tactic, keywords in TACTIC_KEYWORDS.items()
+})
+
+# tactics in priority order (first matching tactic wins)
+_TACTIC_ORDER = tuple(TACTIC_KEYWORDS)
+
+# flat (keyword, tactic priority) pairs in priority order
+_KEYWORD_PRIORITIES = tuple(
+    (kw, priority)
+    for priority, keywords in enumerate(TACTIC_KEYWORDS.values())
+    for kw in keywords
+)
+
+
+def _build_tactic_automaton():
+    """build one automaton mapping every keyword to its tactic priority"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw, priority in _KEYWORD_PRIORITIES:
+        # keep the higher-priority tactic for shared keywords ("help")
+        if not automaton.exists(kw):
+            automaton.add_word(kw, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+_TACTIC_AUTOMATON = _build_tactic_automaton()
+
+# fallback: one case-insensitive regex, one capture group per tactic in
+# priority order; the lookahead tries every start position, so lastindex
+# of each match is the best tactic starting there
+_TACTIC_RE = re.compile(
+    "(?=" + "|".join(
+        "(" + "|".join(map(re.escape, keywords)) + ")"
+        for keywords in TACTIC_KEYWORDS.values()
+    ) + ")",
+    re.IGNORECASE,
+)
+
+# tactic names by index; the last index is "default"
+_TACTIC_NAMES = _TACTIC_ORDER + ("default",)
+
+# STATE_TRANSITIONS flattened: _TRANS[state][tactic_idx] -> (new_state, prob)
+_TRANS = {
+    state: tuple(
+        transitions.get(tactic, transitions["default"])
+        for tactic in _TACTIC_NAMES
+    )
+    for state, transitions in STATE_TRANSITIONS.items()
+}
+
+
+def _detect_tactic_index(message: str) -> int:
+    """index into _TACTIC_NAMES of the best tactic in message"""
+    best = len(_TACTIC_ORDER)
+    
+    if _TACTIC_AUTOMATON is not None:
+        # single pass; keep the best (lowest) priority seen
+        for _, priority in _TACTIC_AUTOMATON.iter(message.lower()):
+            if priority < best:
+                best = priority
+                if best == 0:
+                    break
+    else:
+        # no lowercased copy; the regex folds case itself
+        for match in _TACTIC_RE.finditer(message):
+            priority = match.lastindex - 1
+            if priority < best:
+                best = priority
+                if best == 0:
+                    break
+    
+    return best
+
+
+# one generator per thread rather than per session (a Random is ~2.9 KB):
+# threads don't share generator state, and sessions don't each carry one
+_thread_rng = threading.local()
+
 
-@dataclass
+def _rng() -> random.Random:
+    """this thread's generator"""
+    rng = getattr(_thread_rng, "rng", None)
+    if rng is None:
+        rng = _thread_rng.rng = random.Random()
+    return rng
+
+
+@dataclass(slots=True)
 class EmotionalContext:
     """tracks emotional state for a session"""
     
     session_id: str
     current_state: EmotionalState = EmotionalState.CONFUSED
-    state_history: List[EmotionalState] = None
+    state_history: Deque[EmotionalState] = None
     transition_count: int = 0
     
     def __post_init__(self):
-        if self.state_history is None:
-            self.state_history = [self.current_state]
+        # bounded: only the most recent states are kept
+        self.state_history = deque(
+            self.state_history or [self.current_state], maxlen=STATE_HISTORY_LIMIT
+        )
     
     def detect_tactic(self, message: str) -> str:
         """detect scammer tactic from message"""
-        msg_lower = message.lower()
-        
-        for tactic, keywords in TACTIC_KEYWORDS.items():
-            if any(kw in msg_lower for kw in keywords):
-                return tactic
-        
-        return "default"
+        return _TACTIC_NAMES[_detect_tactic_index(message)]
     
     def transition(self, message: str) -> EmotionalState:
         """transition to new state based on message"""
-        tactic = self.detect_tactic(message)
-        transitions = STATE_TRANSITIONS.get(self.current_state, {})
-        
-        if tactic in transitions:
-            new_state, probability = transitions[tactic]
-        else:
-            new_state, probability = transitions.get("default", (self.current_state, 0.5))
+        new_state, probability = _TRANS[self.current_state][_detect_tactic_index(message)]
         
         # random chance of transition
-        if random.random() < probability:
+        if _rng().random() < probability:
             self.current_state = new_state
             self.state_history.append(new_state)
             self.transition_count += 1
@@ -233,33 +341,33 @@ class EmotionalContext:
     def get_emotional_response(self, language: str = "en") -> str:
         """get response appropriate for current emotional state"""
         responses = EMOTIONAL_RESPONSES.get(self.current_state, {})
-        lang_responses = responses.get(language, responses.get("en", ["..."]))
-        return random.choice(lang_responses)
+        lang_responses = responses.get(language, responses.get("en", ("...",)))
+        return _rng().choice(lang_responses)
     
     def get_state_modifier(self) -> str:
         """get modifier to add to AI prompt based on state"""
-        modifiers = {
-            EmotionalState.CONFUSED: "You are confused and don't understand what's happening.",
-            EmotionalState.CONCERNED: "You are concerned and worried about the situation.",
-            EmotionalState.SCARED: "You are scared and afraid of the consequences.",
-            EmotionalState.COMPLIANT: "You are willing to help and follow instructions.",
-            EmotionalState.HESITANT: "You are having second thoughts and are unsure.",
-            EmotionalState.SUSPICIOUS: "You are becoming suspicious and asking questions.",
-            EmotionalState.PANICKED: "You are in a state of panic and will do anything.",
-        }
-        return modifiers.get(self.current_state, "")
+        return _STATE_MODIFIERS.get(self.current_state, "")
 
 
 class EmotionalStateManager:
     """manages emotional states for all sessions"""
     
-    def __init__(self):
-        self._sessions: Dict[str, EmotionalContext] = {}
+    def __init__(self, max_sessions: int = MAX_SESSIONS):
+        # least recently used sessions are evicted past max_sessions
+        self._sessions: LRUCache = LRUCache(maxsize=max_sessions)
     
     def get_or_create(self, session_id: str) -> EmotionalContext:
-        if session_id not in self._sessions:
-            self._sessions[session_id] = EmotionalContext(session_id=session_id)
-        return self._sessions[session_id]
+        context = self._sessions.get(session_id)
+        if context is None:
+            context = self._sessions[session_id] = EmotionalContext(session_id=session_id)
+        return context
+    
+    def get(self, session_id: str) -> Optional[EmotionalContext]:
+        return self._sessions.get(session_id)
+    
+    def clear_session(self, session_id: str):
+        """drop a session's state when its conversation ends"""
+        self._sessions.pop(session_id, None)
     
     def process_message(self, session_id: str, message: str) -> EmotionalContext:
         """process message and update emotional state"""
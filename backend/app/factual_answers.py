@@ -12,15 +12,45 @@ APIs used:
 - Wikipedia REST API (free, no key)
 """
 
+import asyncio
 import re
-import requests
-from typing import Optional
+import httpx
+from cachetools import TTLCache
+from functools import lru_cache
+from typing import Optional, Tuple
 from urllib.parse import quote
 
 
 # timeout for API requests (seconds)
 REQUEST_TIMEOUT = 5
 
+# shared HTTP/2 clients: keep-alive connections with multiplexed streams;
+# retries cover connection failures only
+_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+_HEADERS = {"User-Agent": "HoneypotBot/1.0 (Educational Project)"}
+
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(http2=True, limits=_LIMITS, retries=2),
+    timeout=REQUEST_TIMEOUT,
+    headers=_HEADERS,
+)
+
+# async client for the event-loop path (see get_factual_answer_async)
+_ASYNC_CLIENT = httpx.AsyncClient(
+    transport=httpx.AsyncHTTPTransport(http2=True, limits=_LIMITS, retries=2),
+    timeout=REQUEST_TIMEOUT,
+    headers=_HEADERS,
+)
+
+DDG_URL = "https://api.duckduckgo.com/"
+WIKI_SEARCH_URL = "https://en.wikipedia.org/w/api.php"
+WIKI_SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/"
+
+# scammers repeat the same questions across sessions; cache answers per
+# topic for an hour, and misses briefly so unanswerable topics aren't refetched
+_ANSWER_CACHE = TTLCache(maxsize=4096, ttl=3600)
+_NO_ANSWER_CACHE = TTLCache(maxsize=4096, ttl=300)
+
 
 # ============================================================
 # FACTUAL QUESTION DETECTION
@@ -43,10 +73,43 @@ FACTUAL_PATTERNS = [
     r'\bक्या\s+है\b',
 ]
 
-# compile patterns for efficiency
-FACTUAL_REGEX = [re.compile(p, re.IGNORECASE) for p in FACTUAL_PATTERNS]
+# one alternation so the message is scanned by a single regex call
+FACTUAL_REGEX = re.compile("|".join(f"(?:{p})" for p in FACTUAL_PATTERNS), re.IGNORECASE)
+
+# every FACTUAL_PATTERNS match contains one of these; text without any of
+# them skips the regex. kept free of 'i'/'s' so str.lower() agrees with
+# re.IGNORECASE folding (e.g. 'İ', 'ſ')
+_FACTUAL_HINTS = ("wh", "how", "def", "mean", "tell", "expla", "know", "ka", "ky", "क्या")
+
+# question starters for the '?' check
+_QUESTION_STARTERS = frozenset(['what', 'who', 'where', 'when', 'why', 'how', 'which', 'can', 'is', 'are', 'do', 'does'])
+
+# patterns to extract topic (one capture group each, in priority order)
+TOPIC_PATTERNS = [
+    r'what\s+is\s+(?:a\s+|an\s+|the\s+)?(.+)',
+    r'who\s+is\s+(.+)',
+    r'where\s+is\s+(.+)',
+    r'what\s+are\s+(.+)',
+    r'how\s+does\s+(.+?)(?:\s+work)?',
+    r'how\s+do\s+(.+?)(?:\s+work)?',
+    r'tell\s+me\s+about\s+(.+)',
+    r'define\s+(.+)',
+    r'meaning\s+of\s+(.+)',
+    r'explain\s+(.+)',
+    r'what\s+does\s+(.+?)\s+mean',
+]
+
+# each alternative is anchored with a lazy any-char prefix so the earliest
+# pattern wins (not the leftmost match); lastindex is the pattern's group
+TOPIC_REGEX = re.compile(
+    "^(?:" + "|".join(f"[\\s\\S]*?{p}" for p in TOPIC_PATTERNS) + ")",
+    re.IGNORECASE,
+)
+
+TOPIC_PREFIX_REGEX = re.compile(r'^(what|who|where|when|why|how|is|are|the|a|an)\s+', re.IGNORECASE)
 
 
+@lru_cache(maxsize=2048)
 def is_factual_question(text: str) -> bool:
     """
     detect if text is asking a factual question.
@@ -63,16 +126,15 @@ def is_factual_question(text: str) -> bool:
     if not text:
         return False
     
-    # check against patterns
-    for pattern in FACTUAL_REGEX:
-        if pattern.search(text):
-            return True
+    # check against patterns (only if a pattern could match at all)
+    lowered = text.lower()
+    if any(hint in lowered for hint in _FACTUAL_HINTS) and FACTUAL_REGEX.search(text):
+        return True
     
     # check for question mark with common question starters
     if '?' in text:
-        starters = ['what', 'who', 'where', 'when', 'why', 'how', 'which', 'can', 'is', 'are', 'do', 'does']
         first_word = text.split()[0].lower().rstrip('?')
-        if first_word in starters:
+        if first_word in _QUESTION_STARTERS:
             return True
     
     return False
@@ -88,28 +150,12 @@ def extract_query_topic(text: str) -> str:
     """
     text = text.strip().rstrip('?').rstrip('.')
     
-    # patterns to extract topic
-    patterns = [
-        r'what\s+is\s+(?:a\s+|an\s+|the\s+)?(.+)',
-        r'who\s+is\s+(.+)',
-        r'where\s+is\s+(.+)',
-        r'what\s+are\s+(.+)',
-        r'how\s+does\s+(.+?)(?:\s+work)?',
-        r'how\s+do\s+(.+?)(?:\s+work)?',
-        r'tell\s+me\s+about\s+(.+)',
-        r'define\s+(.+)',
-        r'meaning\s+of\s+(.+)',
-        r'explain\s+(.+)',
-        r'what\s+does\s+(.+?)\s+mean',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
+    match = TOPIC_REGEX.match(text)
+    if match:
+        return match.group(match.lastindex).strip()
     
     # fallback: return text without common prefixes
-    text = re.sub(r'^(what|who|where|when|why|how|is|are|the|a|an)\s+', '', text, flags=re.IGNORECASE)
+    text = TOPIC_PREFIX_REGEX.sub('', text)
     return text.strip()
 
 
@@ -125,50 +171,69 @@ def duckduckgo_search(query: str) -> Optional[str]:
     FREE - no API key needed!
     """
     try:
-        url = "https://api.duckduckgo.com/"
-        params = {
-            "q": query,
-            "format": "json",
-            "no_html": 1,
-            "skip_disambig": 1,
-        }
-        
-        response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        response = _CLIENT.get(DDG_URL, params=_ddg_params(query))
         
         if response.status_code != 200:
             return None
         
-        data = response.json()
+        return _parse_ddg(response.json())
         
-        # try AbstractText first (main summary)
-        abstract = data.get("AbstractText", "").strip()
-        if abstract and len(abstract) > 20:
-            return _clean_and_shorten(abstract)
-        
-        # try Answer field (for calculations, conversions)
-        answer = data.get("Answer", "").strip()
-        if answer:
-            return _clean_and_shorten(answer)
-        
-        # try Definition
-        definition = data.get("Definition", "").strip()
-        if definition:
-            return _clean_and_shorten(definition)
+    except Exception as e:
+        print(f"[DDG] Error: {e}")
+        return None
+
+
+async def duckduckgo_search_async(query: str) -> Optional[str]:
+    """async duckduckgo_search over the shared httpx client"""
+    try:
+        response = await _ASYNC_CLIENT.get(DDG_URL, params=_ddg_params(query))
         
-        # try first RelatedTopic
-        related = data.get("RelatedTopics", [])
-        if related and isinstance(related, list) and len(related) > 0:
-            first = related[0]
-            if isinstance(first, dict) and first.get("Text"):
-                return _clean_and_shorten(first["Text"])
+        if response.status_code != 200:
+            return None
         
-        return None
+        return _parse_ddg(response.json())
         
     except Exception as e:
         print(f"[DDG] Error: {e}")
         return None
 
 
+def _ddg_params(query: str) -> dict:
+    return {
+        "q": query,
+        "format": "json",
+        "no_html": 1,
+        "skip_disambig": 1,
+    }
+
+
+def _parse_ddg(data: dict) -> Optional[str]:
+    """pick the best answer out of a DuckDuckGo response"""
+    # try AbstractText first (main summary)
+    abstract = data.get("AbstractText", "").strip()
+    if abstract and len(abstract) > 20:
+        return _clean_and_shorten(abstract)
+    
+    # try Answer field (for calculations, conversions)
+    answer = data.get("Answer", "").strip()
+    if answer:
+        return _clean_and_shorten(answer)
+    
+    # try Definition
+    definition = data.get("Definition", "").strip()
+    if definition:
+        return _clean_and_shorten(definition)
+    
+    # try first RelatedTopic
+    related = data.get("RelatedTopics", [])
+    if related and isinstance(related, list) and len(related) > 0:
+        first = related[0]
+        if isinstance(first, dict) and first.get("Text"):
+            return _clean_and_shorten(first["Text"])
+    
+    return None
+
+
 # ============================================================
 # WIKIPEDIA API
 # ============================================================
@@ -180,27 +245,27 @@ def wikipedia_summary(title: str) -> Optional[str]:
     FREE - no API key needed!
     """
     try:
-        # URL encode the title
-        encoded_title = quote(title.replace(" ", "_"))
-        url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{encoded_title}"
-        
-        headers = {
-            "User-Agent": "HoneypotBot/1.0 (Educational Project)"
-        }
-        
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = _CLIENT.get(_wiki_summary_url(title))
         
         if response.status_code != 200:
             return None
         
-        data = response.json()
-        
-        # get extract (summary)
-        extract = data.get("extract", "").strip()
-        if extract and len(extract) > 20:
-            return _clean_and_shorten(extract)
+        return _parse_wiki_summary(response.json())
         
+    except Exception as e:
+        print(f"[WIKI] Summary error: {e}")
         return None
+
+
+async def wikipedia_summary_async(title: str) -> Optional[str]:
+    """async wikipedia_summary over the shared httpx client"""
+    try:
+        response = await _ASYNC_CLIENT.get(_wiki_summary_url(title))
+        
+        if response.status_code != 200:
+            return None
+        
+        return _parse_wiki_summary(response.json())
         
     except Exception as e:
         print(f"[WIKI] Summary error: {e}")
@@ -215,48 +280,89 @@ def wiki_search_and_summary(query: str) -> Optional[str]:
     """
     try:
         # first, search for the query
-        search_url = "https://en.wikipedia.org/w/api.php"
-        params = {
-            "action": "query",
-            "list": "search",
-            "srsearch": query,
-            "format": "json",
-            "srlimit": 1,  # just get first result
-        }
-        
-        headers = {
-            "User-Agent": "HoneypotBot/1.0 (Educational Project)"
-        }
-        
-        response = requests.get(search_url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = _CLIENT.get(WIKI_SEARCH_URL, params=_wiki_search_params(query))
         
         if response.status_code != 200:
             return None
         
-        data = response.json()
+        title = _first_search_title(response.json())
+        if not title:
+            return None
+        
+        # now get summary for that title
+        return wikipedia_summary(title)
         
-        # get first search result
-        search_results = data.get("query", {}).get("search", [])
-        if not search_results:
+    except Exception as e:
+        print(f"[WIKI] Search error: {e}")
+        return None
+
+
+async def wiki_search_and_summary_async(query: str) -> Optional[str]:
+    """async wiki_search_and_summary over the shared httpx client"""
+    try:
+        response = await _ASYNC_CLIENT.get(WIKI_SEARCH_URL, params=_wiki_search_params(query))
+        
+        if response.status_code != 200:
             return None
         
-        # get the title of first result
-        title = search_results[0].get("title")
+        title = _first_search_title(response.json())
         if not title:
             return None
         
-        # now get summary for that title
-        return wikipedia_summary(title)
+        return await wikipedia_summary_async(title)
         
     except Exception as e:
         print(f"[WIKI] Search error: {e}")
         return None
 
 
+def _wiki_summary_url(title: str) -> str:
+    # URL encode the title
+    return WIKI_SUMMARY_URL + quote(title.replace(" ", "_"))
+
+
+def _parse_wiki_summary(data: dict) -> Optional[str]:
+    # get extract (summary)
+    extract = data.get("extract", "").strip()
+    if extract and len(extract) > 20:
+        return _clean_and_shorten(extract)
+    return None
+
+
+def _wiki_search_params(query: str) -> dict:
+    return {
+        "action": "query",
+        "list": "search",
+        "srsearch": query,
+        "format": "json",
+        "srlimit": 1,  # just get first result
+    }
+
+
+def _first_search_title(data: dict) -> Optional[str]:
+    # get the title of the first search result
+    search_results = data.get("query", {}).get("search", [])
+    if not search_results:
+        return None
+    return search_results[0].get("title")
+
+
 # ============================================================
 # HELPER FUNCTIONS
 # ============================================================
 
+# markdown link [text](url) | plain URL | HTML tag | markdown formatting
+_CLEAN_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)|https?://\S+|<[^>]+>|[*_`#]')
+_WS_RE = re.compile(r'\s+')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _clean_repl(match: re.Match) -> str:
+    # links keep their (cleaned) text; everything else is dropped
+    link_text = match.group(1)
+    return _CLEAN_RE.sub(_clean_repl, link_text) if link_text else ''
+
+
 def _clean_and_shorten(text: str, max_sentences: int = 2) -> str:
     """
     clean text and limit to max_sentences.
@@ -265,23 +371,14 @@ def _clean_and_shorten(text: str, max_sentences: int = 2) -> str:
     if not text:
         return ""
     
-    # remove markdown links [text](url)
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-    
-    # remove plain URLs
-    text = re.sub(r'https?://\S+', '', text)
-    
-    # remove HTML tags if any
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # remove markdown formatting
-    text = re.sub(r'[*_`#]', '', text)
+    # remove markdown links, URLs, HTML tags and formatting in one pass
+    text = _CLEAN_RE.sub(_clean_repl, text)
     
     # normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
     
     # split into sentences and take first few
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
     
     if len(sentences) > max_sentences:
@@ -304,20 +401,26 @@ def get_factual_answer(message_text: str) -> Optional[str]:
     3. if no result, try Wikipedia
     4. return None if nothing found
     
+    answers (and misses) are cached per topic, see _ANSWER_CACHE.
     returns clean, short answer ready to be humanized.
     """
     
-    # step 1: check if factual question
-    if not is_factual_question(message_text):
-        return None
-    
-    # extract the topic/query
-    query = extract_query_topic(message_text)
-    if not query or len(query) < 2:
+    # step 1: check if factual question and extract the topic
+    query = _factual_query(message_text)
+    if query is None:
         return None
     
-    print(f"[FACTUAL] Query: '{query}'")
+    key = query.lower()
+    hit, answer = _cached_answer(key)
+    if hit:
+        return answer
     
+    answer = _lookup(query)
+    _remember_answer(key, answer)
+    return answer
+
+
+def _lookup(query: str) -> Optional[str]:
     # step 2: try DuckDuckGo first (faster)
     answer = duckduckgo_search(query)
     if answer:
@@ -335,13 +438,96 @@ def get_factual_answer(message_text: str) -> Optional[str]:
     return None
 
 
+async def get_factual_answer_async(message_text: str) -> Optional[str]:
+    """
+    async get_factual_answer for the event loop.
+    
+    DuckDuckGo and Wikipedia are queried in parallel; the first usable
+    answer wins (DuckDuckGo on a tie) and the other lookup is cancelled.
+    """
+    query = _factual_query(message_text)
+    if query is None:
+        return None
+    
+    key = query.lower()
+    hit, answer = _cached_answer(key)
+    if hit:
+        return answer
+    
+    answer = await _race_lookups(query)
+    _remember_answer(key, answer)
+    return answer
+
+
+async def _race_lookups(query: str) -> Optional[str]:
+    tasks = {
+        asyncio.create_task(duckduckgo_search_async(query)): "DuckDuckGo",
+        asyncio.create_task(wiki_search_and_summary_async(query)): "Wikipedia",
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task, source in tasks.items():
+                if task in done and task.result():
+                    print(f"[FACTUAL] Found via {source}")
+                    return task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+    
+    print(f"[FACTUAL] No answer found for '{query}'")
+    return None
+
+
+def _cached_answer(key: str) -> Tuple[bool, Optional[str]]:
+    """(hit, answer) for a lowercased topic; a cached miss is (True, None)"""
+    answer = _ANSWER_CACHE.get(key)
+    if answer is not None:
+        return True, answer
+    return key in _NO_ANSWER_CACHE, None
+
+
+def _remember_answer(key: str, answer: Optional[str]):
+    if answer:
+        _ANSWER_CACHE[key] = answer
+    else:
+        _NO_ANSWER_CACHE[key] = True
+
+
+def _factual_query(message_text: str) -> Optional[str]:
+    """query topic for a factual question, None if not worth looking up"""
+    if not is_factual_question(message_text):
+        return None
+    
+    query = extract_query_topic(message_text)
+    if not query or len(query) < 2:
+        return None
+    
+    print(f"[FACTUAL] Query: '{query}'")
+    return query
+
+
+async def close_http_client():
+    """close the shared clients (app shutdown)"""
+    _CLIENT.close()
+    await _ASYNC_CLIENT.aclose()
+
+
 def get_humanized_factual_answer(message_text: str) -> Optional[str]:
     """
     get factual answer wrapped in a human-like response.
     suitable for honeypot agent replies.
     """
-    answer = get_factual_answer(message_text)
-    
+    return _humanize(get_factual_answer(message_text))
+
+
+async def get_humanized_factual_answer_async(message_text: str) -> Optional[str]:
+    """async get_humanized_factual_answer"""
+    return _humanize(await get_factual_answer_async(message_text))
+
+
+def _humanize(answer: Optional[str]) -> Optional[str]:
     if not answer:
         return None
     
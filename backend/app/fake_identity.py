@@ -14,34 +14,38 @@ generates:
 """
 
 import random
-import hashlib
-from typing import Dict
-from dataclasses import dataclass
+import string
+import threading
+import zlib
+from typing import Dict, Optional
+from dataclasses import dataclass, field
+
+from cachetools import LRUCache
 
 
 # indian first names
-FIRST_NAMES_MALE = [
+FIRST_NAMES_MALE = (
     "Ramesh", "Suresh", "Mahesh", "Rajesh", "Mukesh", "Dinesh", "Ganesh",
     "Anil", "Sunil", "Vijay", "Sanjay", "Ajay", "Ravi", "Kumar", "Mohan",
     "Sohan", "Gopal", "Krishna", "Shyam", "Ram", "Lakshman", "Bharat",
     "Amit", "Sumit", "Rohit", "Mohit", "Nitin", "Sachin", "Rahul", "Deepak"
-]
+)
 
-FIRST_NAMES_FEMALE = [
+FIRST_NAMES_FEMALE = (
     "Sunita", "Anita", "Kavita", "Savita", "Geeta", "Seema", "Neeta",
     "Rekha", "Shobha", "Usha", "Asha", "Nisha", "Ritu", "Manju", "Anju",
     "Suman", "Poonam", "Kiran", "Priya", "Pooja", "Neha", "Sneha", "Divya",
     "Meera", "Lakshmi", "Sarita", "Mamta", "Kamla", "Radha", "Sita"
-]
+)
 
-LAST_NAMES = [
+LAST_NAMES = (
     "Sharma", "Verma", "Gupta", "Singh", "Kumar", "Yadav", "Patel", "Shah",
     "Mehta", "Joshi", "Pandey", "Mishra", "Tiwari", "Dubey", "Shukla",
     "Agarwal", "Bansal", "Goel", "Jain", "Khanna", "Malhotra", "Kapoor",
     "Reddy", "Nair", "Menon", "Iyer", "Pillai", "Naidu", "Rao", "Choudhary"
-]
+)
 
-CITIES = [
+CITIES = (
     ("Mumbai", "Maharashtra"), ("Delhi", "Delhi"), ("Bangalore", "Karnataka"),
     ("Chennai", "Tamil Nadu"), ("Kolkata", "West Bengal"), ("Hyderabad", "Telangana"),
     ("Pune", "Maharashtra"), ("Ahmedabad", "Gujarat"), ("Jaipur", "Rajasthan"),
@@ -49,22 +53,44 @@ CITIES = [
     ("Indore", "Madhya Pradesh"), ("Bhopal", "Madhya Pradesh"), ("Patna", "Bihar"),
     ("Chandigarh", "Punjab"), ("Coimbatore", "Tamil Nadu"), ("Kochi", "Kerala"),
     ("Surat", "Gujarat"), ("Vadodara", "Gujarat")
-]
+)
 
-OCCUPATIONS = [
+OCCUPATIONS = (
     "Retired Government Employee", "Retired Teacher", "Housewife", "Small Business Owner",
     "Farmer", "Shop Owner", "Auto Driver", "Factory Worker", "Security Guard",
     "Clerk", "Accountant", "Teacher", "Nurse", "Bank Employee (Retired)",
     "Railway Employee (Retired)", "Post Office Employee", "Electrician", "Carpenter",
     "Tailor", "Grocery Store Owner"
-]
+)
+
+BANKS = ("SBI", "PNB", "BOB", "HDFC", "ICICI", "Axis", "Canara", "Union", "BOI", "IDBI")
+
+UPI_SUFFIXES = ("@ybl", "@paytm", "@okaxis", "@oksbi", "@ibl", "@apl", "@upi")
+
+PAN_LETTERS = string.ascii_uppercase
 
-BANKS = ["SBI", "PNB", "BOB", "HDFC", "ICICI", "Axis", "Canara", "Union", "BOI", "IDBI"]
+# every two-letter pair, so a 5-letter PAN prefix is two pairs + one letter.
+# pair i is PAN_LETTERS[i % 26] + PAN_LETTERS[i // 26] - the same letters
+# two single-letter divmods would peel off
+_PAN_PAIRS = tuple(b + a for a in PAN_LETTERS for b in PAN_LETTERS)
 
-UPI_SUFFIXES = ["@ybl", "@paytm", "@okaxis", "@oksbi", "@ibl", "@apl", "@upi"]
+# identities are deterministic per session, so an evicted one is simply rebuilt
+MAX_CACHED_IDENTITIES = 10_000
 
+# one reseedable generator per thread instead of a new Random per identity
+_thread_rng = threading.local()
 
-@dataclass
+
+def _seeded_rng(seed: int) -> random.Random:
+    """this thread's generator, reseeded"""
+    rng = getattr(_thread_rng, "rng", None)
+    if rng is None:
+        rng = _thread_rng.rng = random.Random()
+    rng.seed(seed)
+    return rng
+
+
+@dataclass(slots=True)
 class FakeIdentity:
     """holds a fake victim identity"""
     
@@ -87,32 +113,61 @@ class FakeIdentity:
     # phone (partial)
     phone_last4: str
     
+    # masked display strings, built once in __post_init__
+    location: str = field(default="", init=False, repr=False, compare=False)
+    account_hint: str = field(default="", init=False, repr=False, compare=False)
+    aadhar_hint: str = field(default="", init=False, repr=False, compare=False)
+    pan_hint: str = field(default="", init=False, repr=False, compare=False)
+    phone_hint: str = field(default="", init=False, repr=False, compare=False)
+    
+    # canned sentences the agent repeats across turns
+    intro: str = field(default="", init=False, repr=False, compare=False)
+    partial_account: str = field(default="", init=False, repr=False, compare=False)
+    partial_aadhar: str = field(default="", init=False, repr=False, compare=False)
+    
+    # fields never change after construction, so the dict is built once
+    _dict_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.location = f"{self.city}, {self.state}"
+        self.account_hint = f"XXXX{self.account_last4}"
+        self.aadhar_hint = f"XXXX XXXX {self.aadhar_last4}"
+        self.pan_hint = f"{self.pan_prefix}XXXX"
+        self.phone_hint = f"+91 XXXXX X{self.phone_last4}"
+        self.intro = f"My name is {self.full_name}, I am a {self.occupation} from {self.city}."
+        self.partial_account = f"My account ends with {self.account_last4} in {self.bank_name}"
+        self.partial_aadhar = f"My Aadhar last 4 digits are {self.aadhar_last4}"
+    
     def to_dict(self) -> Dict:
-        return {
+        """cached - callers must not mutate the returned dict"""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "name": self.full_name,
             "gender": self.gender,
             "age": self.age,
             "occupation": self.occupation,
-            "location": f"{self.city}, {self.state}",
+            "location": self.location,
             "bank": self.bank_name,
-            "account_hint": f"XXXX{self.account_last4}",
-            "aadhar_hint": f"XXXX XXXX {self.aadhar_last4}",
-            "pan_hint": f"{self.pan_prefix}XXXX",
+            "account_hint": self.account_hint,
+            "aadhar_hint": self.aadhar_hint,
+            "pan_hint": self.pan_hint,
             "upi_id": self.upi_id,
-            "phone_hint": f"+91 XXXXX X{self.phone_last4}",
+            "phone_hint": self.phone_hint,
         }
+        return self._dict_cache
     
     def get_intro(self) -> str:
         """get a natural introduction"""
-        return f"My name is {self.full_name}, I am a {self.occupation} from {self.city}."
+        return self.intro
     
     def get_partial_account(self) -> str:
         """return masked account for 'verification'"""
-        return f"My account ends with {self.account_last4} in {self.bank_name}"
+        return self.partial_account
     
     def get_partial_aadhar(self) -> str:
         """return masked aadhar"""
-        return f"My Aadhar last 4 digits are {self.aadhar_last4}"
+        return self.partial_aadhar
 
 
 class IdentityGenerator:
@@ -121,49 +176,68 @@ class IdentityGenerator:
     same session_id always returns same identity (deterministic).
     """
     
-    def __init__(self):
-        self._cache: Dict[str, FakeIdentity] = {}
+    def __init__(self, max_cached: int = MAX_CACHED_IDENTITIES):
+        self._cache: LRUCache = LRUCache(maxsize=max_cached)
     
     def get_identity(self, session_id: str) -> FakeIdentity:
         """
         get or generate identity for session.
         deterministic - same session always gets same identity.
         """
-        if session_id in self._cache:
-            return self._cache[session_id]
+        identity = self._cache.get(session_id)
+        if identity is not None:
+            return identity
         
-        # use session_id as seed for consistency
-        seed = int(hashlib.md5(session_id.encode()).hexdigest()[:8], 16)
-        rng = random.Random(seed)
+        # use session_id as seed for consistency.
+        # crc32 is stable across restarts, unlike the builtin hash()
+        seed = zlib.crc32(session_id.encode("utf-8"))
+        rng = _seeded_rng(seed)
         
-        # generate identity
-        gender = rng.choice(["male", "female"])
-        first_name = rng.choice(FIRST_NAMES_MALE if gender == "male" else FIRST_NAMES_FEMALE)
-        last_name = rng.choice(LAST_NAMES)
-        city, state = rng.choice(CITIES)
+        # draw every categorical field from one batch of random bits,
+        # peeling each index off with divmod (mixed radix)
+        bits = rng.getrandbits(128)
+        bits, gender_idx = divmod(bits, 2)
+        gender = "male" if gender_idx == 0 else "female"
+        names = FIRST_NAMES_MALE if gender == "male" else FIRST_NAMES_FEMALE
+        bits, idx = divmod(bits, len(names))
+        first_name = names[idx]
+        bits, idx = divmod(bits, len(LAST_NAMES))
+        last_name = LAST_NAMES[idx]
+        bits, idx = divmod(bits, len(CITIES))
+        city, state = CITIES[idx]
+        bits, idx = divmod(bits, len(OCCUPATIONS))
+        occupation = OCCUPATIONS[idx]
+        bits, idx = divmod(bits, len(BANKS))
+        bank_name = BANKS[idx]
+        bits, idx = divmod(bits, len(UPI_SUFFIXES))
+        upi_suffix = UPI_SUFFIXES[idx]
+        bits, age_offset = divmod(bits, 28)  # 45..72
+        bits, upi_num = divmod(bits, 90)  # 10..99
+        
+        # PAN format: 5 letters
+        bits, pair1 = divmod(bits, len(_PAN_PAIRS))
+        bits, pair2 = divmod(bits, len(_PAN_PAIRS))
+        bits, last = divmod(bits, 26)
+        pan_letters = _PAN_PAIRS[pair1] + _PAN_PAIRS[pair2] + PAN_LETTERS[last]
         
         # generate consistent "partial" financial info
         account_last4 = str(rng.randint(1000, 9999))
         aadhar_last4 = str(rng.randint(1000, 9999))
         phone_last4 = str(rng.randint(1000, 9999))
         
-        # PAN format: 5 letters
-        pan_letters = "".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=5))
-        
         # UPI ID based on name
-        upi_name = first_name.lower() + str(rng.randint(10, 99))
-        upi_id = upi_name + rng.choice(UPI_SUFFIXES)
+        upi_id = f"{first_name.lower()}{10 + upi_num}{upi_suffix}"
         
         identity = FakeIdentity(
             first_name=first_name,
             last_name=last_name,
             full_name=f"{first_name} {last_name}",
             gender=gender,
-            age=rng.randint(45, 72),  # older = more believable victim
-            occupation=rng.choice(OCCUPATIONS),
+            age=45 + age_offset,  # older = more believable victim
+            occupation=occupation,
             city=city,
             state=state,
-            bank_name=rng.choice(BANKS),
+            bank_name=bank_name,
             account_last4=account_last4,
             aadhar_last4=aadhar_last4,
             pan_prefix=pan_letters,
@@ -15,11 +15,89 @@ uses pollinations.ai (free, no api key needed)
 """
 
 import requests
+import asyncio
 import base64
 import random
 import urllib.parse
+from functools import lru_cache
 from datetime import datetime, timedelta
 from io import BytesIO
+from typing import Dict, Final, Iterable, List, Tuple
+
+import httpx
+
+try:
+    import ahocorasick
+except ImportError:  # optional: fall back to per-keyword substring checks
+    ahocorasick = None
+
+
+# screenshot request patterns, checked in order - first type with a hit wins
+IMAGE_REQUEST_PATTERNS: Final[Dict[str, Tuple[str, ...]]] = {
+    "bank_balance": (
+        "screenshot", "balance", "bank balance", "account balance",
+        "show balance", "send screenshot", "balance screenshot",
+        "खाते का स्क्रीनशॉट", "बैलेंस दिखाओ", "बैलेंस स्क्रीनशॉट"
+    ),
+    "upi_payment": (
+        "payment screenshot", "upi screenshot", "send payment",
+        "payment proof", "transaction screenshot", "payment ss",
+        "पेमेंट स्क्रीनशॉट", "यूपीआई स्क्रीनशॉट"
+    ),
+    "otp": (
+        "otp screenshot", "send otp", "otp photo", "show otp",
+        "otp message", "sms screenshot",
+        "ओटीपी भेजो", "ओटीपी स्क्रीनशॉट"
+    ),
+    "id_card": (
+        "aadhar", "aadhaar", "pan card", "id proof", "id card",
+        "photo id", "aadhar photo", "pan photo",
+        "आधार", "पैन कार्ड", "आईडी"
+    ),
+    "bank_statement": (
+        "statement", "bank statement", "account statement",
+        "passbook", "transaction history",
+        "स्टेटमेंट", "पासबुक"
+    ),
+}
+
+_IMAGE_TYPES: Final = tuple(IMAGE_REQUEST_PATTERNS)
+
+
+# HEAD requests make pollinations render before the scammer opens the link
+PREWARM_TIMEOUT: Final = 30.0
+
+_PREWARM_CLIENT = httpx.AsyncClient(
+    timeout=PREWARM_TIMEOUT,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+)
+
+# strong refs so fire-and-forget prewarm tasks aren't garbage collected
+_PREWARM_TASKS: set = set()
+
+
+@lru_cache(maxsize=256)
+def _encode_prompt(prompt: str) -> str:
+    """url-encode a prompt; the same image type mostly repeats the same prompt"""
+    return urllib.parse.quote(prompt)
+
+
+def _build_image_automaton():
+    """one automaton over every keyword; values are (type_idx, kw_idx) pairs"""
+    if ahocorasick is None:
+        return None
+    
+    owners = {}
+    for type_idx, keywords in enumerate(IMAGE_REQUEST_PATTERNS.values()):
+        for kw_idx, kw in enumerate(keywords):
+            owners.setdefault(kw, []).append((type_idx, kw_idx))
+    
+    automaton = ahocorasick.Automaton()
+    for kw, pairs in owners.items():
+        automaton.add_word(kw, tuple(pairs))
+    automaton.make_automaton()
+    return automaton
 
 
 class ImageGenerator:
@@ -34,6 +112,9 @@ class ImageGenerator:
         
         # placeholder image services (instant, free)
         self.placeholder_url = "https://placehold.co"
+        
+        # single-pass keyword matcher for detect_image_request
+        self._automaton = _build_image_automaton()
     
     def generate_bank_screenshot(self, bank_name: str = "SBI", balance: str = "₹45,234.50") -> dict:
         """
@@ -157,7 +238,7 @@ class ImageGenerator:
         
         try:
             # encode prompt for URL
-            encoded_prompt = urllib.parse.quote(prompt)
+            encoded_prompt = _encode_prompt(prompt)
             
             # pollinations generates image at this URL
             image_url = f"{self.pollinations_url}{encoded_prompt}"
@@ -205,44 +286,36 @@ class ImageGenerator:
         returns type of image they want
         """
         
-        msg_lower = message.lower()
+        # keywords are lowercase ascii or caseless devanagari, so an
+        # already-lowercase message can be scanned as-is
+        msg_lower = message if message.islower() else message.lower()
         
-        # screenshot request patterns
-        patterns = {
-            "bank_balance": [
-                "screenshot", "balance", "bank balance", "account balance",
-                "show balance", "send screenshot", "balance screenshot",
-                "खाते का स्क्रीनशॉट", "बैलेंस दिखाओ", "बैलेंस स्क्रीनशॉट"
-            ],
-            "upi_payment": [
-                "payment screenshot", "upi screenshot", "send payment",
-                "payment proof", "transaction screenshot", "payment ss",
-                "पेमेंट स्क्रीनशॉट", "यूपीआई स्क्रीनशॉट"
-            ],
-            "otp": [
-                "otp screenshot", "send otp", "otp photo", "show otp",
-                "otp message", "sms screenshot",
-                "ओटीपी भेजो", "ओटीपी स्क्रीनशॉट"
-            ],
-            "id_card": [
-                "aadhar", "aadhaar", "pan card", "id proof", "id card",
-                "photo id", "aadhar photo", "pan photo",
-                "आधार", "पैन कार्ड", "आईडी"
-            ],
-            "bank_statement": [
-                "statement", "bank statement", "account statement",
-                "passbook", "transaction history",
-                "स्टेटमेंट", "पासबुक"
-            ]
-        }
+        if self._automaton is None:
+            for img_type, keywords in IMAGE_REQUEST_PATTERNS.items():
+                if any(kw in msg_lower for kw in keywords):
+                    return {
+                        "wants_image": True,
+                        "image_type": img_type,
+                        "keywords_matched": [kw for kw in keywords if kw in msg_lower]
+                    }
+            return {"wants_image": False, "image_type": None}
         
-        for img_type, keywords in patterns.items():
-            if any(kw in msg_lower for kw in keywords):
-                return {
-                    "wants_image": True,
-                    "image_type": img_type,
-                    "keywords_matched": [kw for kw in keywords if kw in msg_lower]
-                }
+        # one scan collects every hit; the earliest type keeps priority
+        hits = set()
+        for _, pairs in self._automaton.iter(msg_lower):
+            hits.update(pairs)
+        
+        if hits:
+            type_idx = min(hits)[0]
+            img_type = _IMAGE_TYPES[type_idx]
+            keywords = IMAGE_REQUEST_PATTERNS[img_type]
+            return {
+                "wants_image": True,
+                "image_type": img_type,
+                "keywords_matched": [
+                    keywords[kw_idx] for t, kw_idx in sorted(hits) if t == type_idx
+                ]
+            }
         
         return {"wants_image": False, "image_type": None}
 
@@ -251,23 +324,75 @@ class ImageGenerator:
 image_gen = ImageGenerator()
 
 
+# request type -> generator method
+_DISPATCH = {
+    "bank_balance": image_gen.generate_bank_screenshot,
+    "upi_payment": image_gen.generate_upi_screenshot,
+    "otp": image_gen.generate_otp_screenshot,
+    "id_card": image_gen.generate_id_screenshot,
+    "bank_statement": image_gen.generate_bank_statement,
+    "error": image_gen.generate_error_screenshot,
+}
+
+
 def generate_image_for_request(request_type: str, **kwargs) -> dict:
     """convenience function to generate images"""
     
-    if request_type == "bank_balance":
-        return image_gen.generate_bank_screenshot(**kwargs)
-    elif request_type == "upi_payment":
-        return image_gen.generate_upi_screenshot(**kwargs)
-    elif request_type == "otp":
-        return image_gen.generate_otp_screenshot(**kwargs)
-    elif request_type == "id_card":
-        return image_gen.generate_id_screenshot(**kwargs)
-    elif request_type == "bank_statement":
-        return image_gen.generate_bank_statement(**kwargs)
-    elif request_type == "error":
-        return image_gen.generate_error_screenshot(**kwargs)
-    else:
+    generate = _DISPATCH.get(request_type)
+    if generate is None:
         return image_gen.generate_error_screenshot(error_type="network")
+    return generate(**kwargs)
+
+
+async def _prewarm_url(url: str) -> bool:
+    """ask pollinations for the image once so it's rendered ahead of time"""
+    try:
+        response = await _PREWARM_CLIENT.head(url)
+        return response.status_code < 400
+    except httpx.HTTPError as e:
+        print(f"[IMAGE] Prewarm failed: {e}")
+        return False
+
+
+async def prewarm_images(urls: Iterable[str]) -> List[bool]:
+    """prewarm several image urls concurrently"""
+    return await asyncio.gather(*(_prewarm_url(url) for url in urls))
+
+
+def schedule_prewarm(urls: Iterable[str]):
+    """prewarm in the background without holding up the caller"""
+    urls = [url for url in urls if url]
+    if not urls:
+        return
+    
+    task = asyncio.create_task(prewarm_images(urls))
+    _PREWARM_TASKS.add(task)
+    task.add_done_callback(_PREWARM_TASKS.discard)
+
+
+async def generate_images_batch(
+    image_requests: List[Tuple[str, dict]],
+    prewarm: bool = True
+) -> List[dict]:
+    """
+    generate several images at once, e.g. when a scammer asks for
+    multiple screenshots in one go.
+    
+    args:
+        image_requests: (request_type, kwargs) pairs for generate_image_for_request
+        prewarm: HEAD every generated url concurrently before returning
+    """
+    results = [generate_image_for_request(request_type, **kwargs) for request_type, kwargs in image_requests]
+    
+    if prewarm:
+        await prewarm_images([r["image_url"] for r in results if r.get("success")])
+    
+    return results
+
+
+async def close_image_client():
+    """close the shared prewarm client (app shutdown)"""
+    await _PREWARM_CLIENT.aclose()
 
 
 def check_image_request(message: str) -> dict:
@@ -12,16 +12,17 @@ import asyncio
 import os
 import sys
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from motor.motor_asyncio import AsyncIOMotorClient
-from beanie import init_beanie
+from beanie import PydanticObjectId, init_beanie
 
 from app.core.config import settings
 from app.core.security import hash_password
+from app.db.mongodb import drop_legacy_indexes
 from app.db.models.user import User, UserRole
 from app.db.models.user_settings import UserSettings
 from app.db.models.scan import ScanRequest
@@ -34,10 +35,25 @@ async def init_database():
     """Initialize database connection and Beanie ODM."""
     print("🔌 Connecting to MongoDB...")
     
-    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    # Seeding is a short burst of concurrent writes - a small, compressed
+    # pool is enough (same env knobs as app.db.mongodb, smaller defaults)
+    client = AsyncIOMotorClient(
+        settings.MONGODB_URL,
+        maxPoolSize=int(os.getenv("MONGO_POOL_MAX", "50")),
+        minPoolSize=int(os.getenv("MONGO_POOL_MIN", "5")),
+        compressors=os.getenv("MONGO_COMPRESSORS", "zstd,zlib"),
+        serverSelectionTimeoutMS=3000,
+    )
+    
+    # Select the primary up front so a bad URL fails fast, before seeding
+    await client.admin.command("ping")
+    
+    # Legacy indexes would clash with the ones init_beanie creates
+    database = client[settings.MONGODB_DB_NAME]
+    await drop_legacy_indexes(database)
     
     await init_beanie(
-        database=client[settings.MONGODB_DB_NAME],
+        database=database,
         document_models=[
             User,
             UserSettings,
@@ -62,52 +78,56 @@ async def create_indexes():
     # Using get_settings().motor_collection for async motor operations
     
     try:
-        # User indexes - additional indexes beyond Indexed() fields
         user_collection = User.get_settings().motor_collection
-        await user_collection.create_index("verification_token")
-        await user_collection.create_index("reset_token")
-        await user_collection.create_index("api_key")
-        
-        # Scan indexes
         scan_collection = ScanRequest.get_settings().motor_collection
-        await scan_collection.create_index("user_id")
-        await scan_collection.create_index("created_at")
-        await scan_collection.create_index([("user_id", 1), ("created_at", -1)])
-        
-        # Threat indexes
         threat_collection = BlockedThreat.get_settings().motor_collection
-        await threat_collection.create_index("user_id")
-        await threat_collection.create_index("status")
-        await threat_collection.create_index("threat_type")
-        await threat_collection.create_index("created_at")
-        
-        # Subscription indexes
         sub_collection = Subscription.get_settings().motor_collection
-        await sub_collection.create_index("user_id")
-        await sub_collection.create_index("status")
-        
-        # Session indexes
+        plan_collection = Plan.get_settings().motor_collection
         session_collection = HoneypotSession.get_settings().motor_collection
-        await session_collection.create_index("session_id", unique=True)
-        await session_collection.create_index("user_id")
-        await session_collection.create_index("expires_at")
         
-        print("✅ Indexes created")
+        # (label, pending create_index) - all sent concurrently below
+        index_jobs = [
+            # User indexes - token/OAuth/role indexes are declared on User.Settings
+            ("users.api_key", user_collection.create_index("api_key")),
+            
+            # Scan indexes - (user_id, created_at) also serves user_id-only lookups
+            ("scans.created_at", scan_collection.create_index("created_at")),
+            ("scans.user_id+created_at", scan_collection.create_index([("user_id", 1), ("created_at", -1)])),
+            
+            # Threat indexes - user-scoped compound indexes are declared on BlockedThreat.Settings
+            ("threats.status", threat_collection.create_index("status")),
+            ("threats.threat_type", threat_collection.create_index("threat_type")),
+            
+            # Subscription indexes
+            ("subscriptions.user_id", sub_collection.create_index("user_id")),
+            ("subscriptions.status", sub_collection.create_index("status")),
+            
+            # Plan indexes - seed_plans upserts on tier
+            ("plans.tier", plan_collection.create_index("tier", unique=True)),
+            
+            # Session indexes
+            ("sessions.session_id", session_collection.create_index("session_id", unique=True)),
+            ("sessions.user_id", session_collection.create_index("user_id")),
+            ("sessions.expires_at", session_collection.create_index("expires_at")),
+        ]
+        
+        # One failure (e.g. an existing index with other options) doesn't cancel the rest
+        results = await asyncio.gather(*(job for _, job in index_jobs), return_exceptions=True)
+        
+        failed = [(label, result) for (label, _), result in zip(index_jobs, results) if isinstance(result, Exception)]
+        for label, error in failed:
+            print(f"⚠️  Index {label} may already exist or couldn't be created: {error}")
+        
+        print(f"✅ Indexes created ({len(index_jobs) - len(failed)}/{len(index_jobs)})")
     except Exception as e:
         print(f"⚠️  Some indexes may already exist or couldn't be created: {e}")
         print("   Continuing anyway - Beanie creates basic indexes automatically")
 
 
-async def seed_plans():
-    """Create default subscription plans."""
+async def seed_plans() -> Dict[PlanTier, Plan]:
+    """Create default subscription plans. Returns the plans keyed by tier."""
     print("📦 Seeding subscription plans...")
     
-    # Check if plans already exist
-    existing_plans = await Plan.find_all().count()
-    if existing_plans > 0:
-        print("  ⏭️  Plans already exist, skipping...")
-        return
-    
     plans = [
         Plan(
             name="Free",
@@ -169,48 +189,71 @@ async def seed_plans():
         )
     ]
     
-    for plan in plans:
-        await plan.insert()
-        print(f"  ✅ Created plan: {plan.name}")
+    # One unordered upsert per tier ($setOnInsert) - idempotent, no existence
+    # check, and the unique plans.tier index keeps concurrent runs from racing
+    created = await Plan.bulk_upsert_raw(plans, key=("tier",))
+    if created < len(plans):
+        # Some tiers were already there - their stored ids are the real ones
+        print(f"  ⏭️  {len(plans) - created} plans already exist, skipping...")
+        plans = await Plan.find_all().to_list()
     
-    print(f"✅ Created {len(plans)} plans")
+    print(f"✅ Created {created} plans")
+    return {plan.tier: plan for plan in plans}
 
 
 async def create_admin_user(
     email: str = None,
     password: str = None,
-    name: str = "Admin"
+    name: str = "Admin",
+    enterprise_plan: Optional[Plan] = None,
+    plans_task: Optional["asyncio.Task[Dict[PlanTier, Plan]]"] = None
 ) -> Optional[User]:
-    """Create admin user if it doesn't exist."""
+    """
+    Create admin user if it doesn't exist.
+    Pass enterprise_plan (from seed_plans) to skip looking it up, or a
+    still-running seed_plans task to hash the password while it runs.
+    """
     print("👤 Creating admin user...")
     
     # Use environment variables or defaults
     admin_email = email or os.getenv("ADMIN_EMAIL", "admin@scamshield.io")
     admin_password = password or os.getenv("ADMIN_PASSWORD", "Admin@123!")
     
-    # Check if admin exists
-    existing_admin = await User.find_one(User.email == admin_email.lower())
-    if existing_admin:
-        print(f"  ⏭️  Admin user already exists: {admin_email}")
-        return existing_admin
+    # bcrypt is slow - run it off the loop so pending plan inserts keep going
+    password_hash = await asyncio.to_thread(hash_password, admin_password)
+    
+    if enterprise_plan is None and plans_task is not None:
+        enterprise_plan = (await plans_task).get(PlanTier.ENTERPRISE)
+    if enterprise_plan is None:
+        enterprise_plan = await Plan.find_one(Plan.tier == PlanTier.ENTERPRISE)
     
-    # Create admin user
+    # Create admin user (tier set up front - no second save needed)
     admin = User(
         email=admin_email.lower(),
-        password_hash=hash_password(admin_password),
+        password_hash=password_hash,
         full_name=name,
         role=UserRole.ADMIN,
         is_verified=True,
         is_active=True
     )
-    await admin.insert()
+    if enterprise_plan:
+        admin.active_tier = PlanTier.ENTERPRISE
+    admin.id = PydanticObjectId()
     
-    # Create settings
-    settings_obj = UserSettings(user_id=str(admin.id))
-    await settings_obj.insert()
+    # Upsert on the unique email index - an existing admin is left untouched
+    doc = admin.model_dump(by_alias=True, exclude={"id", "revision_id"})
+    doc["_id"] = admin.id
+    result = await User.get_settings().motor_collection.update_one(
+        {"email": admin.email},
+        {"$setOnInsert": doc},
+        upsert=True
+    )
+    if result.upserted_id is None:
+        print(f"  ⏭️  Admin user already exists: {admin_email}")
+        return await User.find_one(User.email == admin.email)
     
-    # Create enterprise subscription
-    enterprise_plan = await Plan.find_one(Plan.tier == PlanTier.ENTERPRISE)
+    # Settings and subscription only need admin.id - insert them together
+    inserts = [UserSettings(user_id=str(admin.id)).insert()]
     if enterprise_plan:
         subscription = Subscription(
             user_id=str(admin.id),
@@ -218,7 +261,8 @@ async def create_admin_user(
             plan_tier=PlanTier.ENTERPRISE,
             status=SubscriptionStatus.ACTIVE
         )
-        await subscription.insert()
+        inserts.append(subscription.insert())
+    await asyncio.gather(*inserts)
     
     print(f"  ✅ Admin user created: {admin_email}")
     print(f"  ⚠️  Default password: {admin_password}")
@@ -227,19 +271,14 @@ async def create_admin_user(
     return admin
 
 
-async def seed_sample_threats():
+async def seed_sample_threats(user_id: Optional[str] = None):
     """Create sample threat data for demo purposes."""
     print("🛡️ Seeding sample threats...")
     
-    # Check if threats already exist
-    existing_threats = await BlockedThreat.find_all().count()
-    if existing_threats > 0:
-        print("  ⏭️  Threats already exist, skipping...")
-        return
-    
     # Get admin user for associating sample threats
-    admin = await User.find_one(User.role == UserRole.ADMIN)
-    user_id = str(admin.id) if admin else "demo_user"
+    if user_id is None:
+        admin = await User.find_one(User.role == UserRole.ADMIN)
+        user_id = str(admin.id) if admin else "demo_user"
     
     sample_threats = [
         BlockedThreat(
@@ -289,10 +328,10 @@ async def seed_sample_threats():
         )
     ]
     
-    for threat in sample_threats:
-        await threat.insert()
+    # Keyed on (user_id, sender_info) so re-running only fills in missing samples
+    inserted = await BlockedThreat.bulk_upsert_raw(sample_threats, key=("user_id", "sender_info"))
     
-    print(f"✅ Created {len(sample_threats)} sample threats")
+    print(f"✅ Created {inserted} sample threats")
 
 
 async def print_summary():
@@ -301,10 +340,11 @@ async def print_summary():
     print("📊 DATABASE SUMMARY")
     print("=" * 50)
     
-    users = await User.find_all().count()
-    plans = await Plan.find_all().count()
-    threats = await BlockedThreat.find_all().count()
-    scans = await ScanRequest.find_all().count()
+    # Unfiltered totals come from collection metadata - no scan, all at once
+    users, plans, threats, scans = await asyncio.gather(*(
+        model.get_settings().motor_collection.estimated_document_count()
+        for model in (User, Plan, BlockedThreat, ScanRequest)
+    ))
     
     print(f"  👤 Users: {users}")
     print(f"  📦 Plans: {plans}")
@@ -326,14 +366,15 @@ async def main():
         # Create indexes
         await create_indexes()
         
-        # Seed plans
-        await seed_plans()
+        # Seed plans in the background - only the admin's subscription needs them
+        plans_task = asyncio.create_task(seed_plans())
         
-        # Create admin user
-        await create_admin_user()
+        # Create admin user (waits on plans_task after hashing the password)
+        admin = await create_admin_user(plans_task=plans_task)
+        await plans_task
         
         # Seed sample threats (optional, for demo)
-        await seed_sample_threats()
+        await seed_sample_threats(str(admin.id) if admin else None)
         
         # Print summary
         await print_summary()
@@ -22,89 +22,127 @@ extracts:
 author: honeypot team
 """
 
+import asyncio
+import json
+import multiprocessing
+import os
 import re
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional, Tuple
 from datetime import datetime
 
+try:
+    import ahocorasick
+except ImportError:  # optional: fall back to per-needle substring checks
+    ahocorasick = None
 
-@dataclass
+try:
+    import hyperscan
+except ImportError:  # optional: every pattern is run with re
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to stdlib json
+    orjson = None
+
+
+def _json_default(obj):
+    """json fallback for the set-typed intel collections"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"type {type(obj).__name__} is not json serializable")
+
+
+@dataclass(slots=True)
 class ExtractedIntel:
-    """holds all extracted intelligence from a conversation"""
+    """
+    holds all extracted intelligence from a conversation.
+    collections are sets so merging dedupes as it goes.
+    """
     
     # core financial
-    bank_accounts: List[str] = field(default_factory=list)
-    upi_ids: List[str] = field(default_factory=list)
-    ifsc_codes: List[str] = field(default_factory=list)
-    card_numbers: List[str] = field(default_factory=list)
+    bank_accounts: Set[str] = field(default_factory=set)
+    upi_ids: Set[str] = field(default_factory=set)
+    ifsc_codes: Set[str] = field(default_factory=set)
+    card_numbers: Set[str] = field(default_factory=set)
     
     # contact info
-    phone_numbers: List[str] = field(default_factory=list)
-    email_addresses: List[str] = field(default_factory=list)
-    whatsapp_numbers: List[str] = field(default_factory=list)
+    phone_numbers: Set[str] = field(default_factory=set)
+    email_addresses: Set[str] = field(default_factory=set)
+    whatsapp_numbers: Set[str] = field(default_factory=set)
     
     # web/links
-    phishing_links: List[str] = field(default_factory=list)
-    domains: List[str] = field(default_factory=list)
+    phishing_links: Set[str] = field(default_factory=set)
+    domains: Set[str] = field(default_factory=set)
     
     # identity
-    aadhar_numbers: List[str] = field(default_factory=list)
-    pan_numbers: List[str] = field(default_factory=list)
-    names: List[str] = field(default_factory=list)
+    aadhar_numbers: Set[str] = field(default_factory=set)
+    pan_numbers: Set[str] = field(default_factory=set)
+    names: Set[str] = field(default_factory=set)
     
     # crypto
-    crypto_addresses: List[str] = field(default_factory=list)
+    crypto_addresses: Set[str] = field(default_factory=set)
     
     # financial amounts
-    amounts: List[str] = field(default_factory=list)
+    amounts: Set[str] = field(default_factory=set)
     
     # analysis
-    suspicious_keywords: List[str] = field(default_factory=list)
-    tactics_detected: List[str] = field(default_factory=list)
+    suspicious_keywords: Set[str] = field(default_factory=set)
+    tactics_detected: Set[str] = field(default_factory=set)
     scam_type: str = ""
     risk_score: int = 0
     
     def to_dict(self) -> Dict:
-        """convert to dict for json response - deduped"""
+        """convert to dict for json response"""
         return {
-            "bankAccounts": list(set(self.bank_accounts)),
-            "upiIds": list(set(self.upi_ids)),
-            "ifscCodes": list(set(self.ifsc_codes)),
-            "cardNumbers": list(set(self.card_numbers)),
-            "phoneNumbers": list(set(self.phone_numbers)),
-            "emailAddresses": list(set(self.email_addresses)),
-            "whatsappNumbers": list(set(self.whatsapp_numbers)),
-            "phishingLinks": list(set(self.phishing_links)),
-            "domains": list(set(self.domains)),
-            "aadharNumbers": list(set(self.aadhar_numbers)),
-            "panNumbers": list(set(self.pan_numbers)),
-            "names": list(set(self.names)),
-            "cryptoAddresses": list(set(self.crypto_addresses)),
-            "amounts": list(set(self.amounts)),
-            "suspiciousKeywords": list(set(self.suspicious_keywords)),
-            "tacticsDetected": list(set(self.tactics_detected)),
+            "bankAccounts": list(self.bank_accounts),
+            "upiIds": list(self.upi_ids),
+            "ifscCodes": list(self.ifsc_codes),
+            "cardNumbers": list(self.card_numbers),
+            "phoneNumbers": list(self.phone_numbers),
+            "emailAddresses": list(self.email_addresses),
+            "whatsappNumbers": list(self.whatsapp_numbers),
+            "phishingLinks": list(self.phishing_links),
+            "domains": list(self.domains),
+            "aadharNumbers": list(self.aadhar_numbers),
+            "panNumbers": list(self.pan_numbers),
+            "names": list(self.names),
+            "cryptoAddresses": list(self.crypto_addresses),
+            "amounts": list(self.amounts),
+            "suspiciousKeywords": list(self.suspicious_keywords),
+            "tacticsDetected": list(self.tactics_detected),
             "scamType": self.scam_type,
             "riskScore": self.risk_score
         }
     
+    def to_json_bytes(self) -> bytes:
+        """to_dict() serialized straight to json bytes"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), default=_json_default)
+        return json.dumps(self.to_dict(), default=_json_default, separators=(",", ":")).encode("utf-8")
+    
     def merge(self, other: 'ExtractedIntel'):
         """combine intel from another extraction"""
-        self.bank_accounts.extend(other.bank_accounts)
-        self.upi_ids.extend(other.upi_ids)
-        self.ifsc_codes.extend(other.ifsc_codes)
-        self.card_numbers.extend(other.card_numbers)
-        self.phone_numbers.extend(other.phone_numbers)
-        self.email_addresses.extend(other.email_addresses)
-        self.whatsapp_numbers.extend(other.whatsapp_numbers)
-        self.phishing_links.extend(other.phishing_links)
-        self.domains.extend(other.domains)
-        self.aadhar_numbers.extend(other.aadhar_numbers)
-        self.pan_numbers.extend(other.pan_numbers)
-        self.names.extend(other.names)
-        self.crypto_addresses.extend(other.crypto_addresses)
-        self.amounts.extend(other.amounts)
-        self.suspicious_keywords.extend(other.suspicious_keywords)
-        self.tactics_detected.extend(other.tactics_detected)
+        self.bank_accounts |= other.bank_accounts
+        self.upi_ids |= other.upi_ids
+        self.ifsc_codes |= other.ifsc_codes
+        self.card_numbers |= other.card_numbers
+        self.phone_numbers |= other.phone_numbers
+        self.email_addresses |= other.email_addresses
+        self.whatsapp_numbers |= other.whatsapp_numbers
+        self.phishing_links |= other.phishing_links
+        self.domains |= other.domains
+        self.aadhar_numbers |= other.aadhar_numbers
+        self.pan_numbers |= other.pan_numbers
+        self.names |= other.names
+        self.crypto_addresses |= other.crypto_addresses
+        self.amounts |= other.amounts
+        self.suspicious_keywords |= other.suspicious_keywords
+        self.tactics_detected |= other.tactics_detected
         
         # keep highest risk score
         self.risk_score = max(self.risk_score, other.risk_score)
@@ -123,12 +161,12 @@ class ExtractedIntel:
     def get_intel_count(self) -> int:
         """count total intel pieces"""
         return (
-            len(set(self.bank_accounts)) +
-            len(set(self.upi_ids)) +
-            len(set(self.phone_numbers)) +
-            len(set(self.email_addresses)) +
-            len(set(self.phishing_links)) +
-            len(set(self.names))
+            len(self.bank_accounts) +
+            len(self.upi_ids) +
+            len(self.phone_numbers) +
+            len(self.email_addresses) +
+            len(self.phishing_links) +
+            len(self.names)
         )
 
 
@@ -228,6 +266,100 @@ PATTERNS = {
     ],
 }
 
+# compiled once at import, as tuples. these categories are matched
+# case-insensitively; ifsc/pan run on upper-cased text and card/crypto
+# stay case-sensitive (base58 addresses are case-significant).
+# each pattern keeps its own findall pass on purpose: patterns in a category
+# overlap ("+91 98765 43210" is one phone match and "98765 43210" another),
+# and a single alternation would only return the first of them
+_IGNORECASE_CATEGORIES = frozenset({
+    "upi_id", "phone", "bank_account", "email", "link", "aadhar", "amount", "whatsapp",
+})
+
+COMPILED_PATTERNS = {
+    category: tuple(
+        re.compile(p, re.IGNORECASE if category in _IGNORECASE_CATEGORIES else 0)
+        for p in patterns
+    )
+    for category, patterns in PATTERNS.items()
+}
+
+# optional hyperscan prefilter: one scan over the text finds which patterns
+# can match at all, and re.findall (which keeps the leftmost, non-overlapping,
+# group-capturing results the extractors rely on) only runs those.
+# used on ascii text without \x1c-\x1f only - there hyperscan's \d \s \b
+# and caseless matching agree with re's unicode ones. ifsc/pan are scanned
+# caselessly since re sees them upper-cased
+_HS_PATTERN_IDS = tuple(
+    (category, index)
+    for category, patterns in PATTERNS.items()
+    for index in range(len(patterns))
+)
+_HS_IDS_BY_CATEGORY = {
+    category: tuple(pid for pid, (c, _) in enumerate(_HS_PATTERN_IDS) if c == category)
+    for category in PATTERNS
+}
+_HS_UNSAFE_CHARS = re.compile(r"[\x1c-\x1f]")
+_hs_local = threading.local()  # per-thread scratch + last scan
+
+
+def _build_hyperscan_db():
+    """compile every pattern into one hyperscan database (None without hyperscan)"""
+    if hyperscan is None:
+        return None
+    
+    flags = []
+    for category, _ in _HS_PATTERN_IDS:
+        caseless = category in _IGNORECASE_CATEGORIES or category in ("ifsc", "pan")
+        flags.append(hyperscan.HS_FLAG_SINGLEMATCH | (hyperscan.HS_FLAG_CASELESS if caseless else 0))
+    
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[PATTERNS[category][index].encode("utf-8") for category, index in _HS_PATTERN_IDS],
+        ids=list(range(len(_HS_PATTERN_IDS))),
+        elements=len(_HS_PATTERN_IDS),
+        flags=flags,
+    )
+    return db
+
+
+_HS_DATABASE = _build_hyperscan_db()
+
+
+def _hyperscan_hits(text: str) -> Optional[Set[int]]:
+    """ids of the patterns that match somewhere in text, or None if it can't tell"""
+    if _HS_DATABASE is None or not text.isascii() or _HS_UNSAFE_CHARS.search(text):
+        return None
+    
+    # extract_from_text asks once per category - scan each text only once
+    if getattr(_hs_local, "text", None) is text:
+        return _hs_local.hits
+    
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_HS_DATABASE)
+    
+    hits = set()
+    _HS_DATABASE.scan(
+        text.encode("ascii"),
+        match_event_handler=lambda pid, start, end, flags, context: hits.add(pid),
+        scratch=scratch,
+    )
+    _hs_local.text, _hs_local.hits = text, hits
+    return hits
+
+
+def _patterns_for(category: str, text: str) -> Tuple[re.Pattern, ...]:
+    """compiled patterns of category worth running on text"""
+    hits = _hyperscan_hits(text)
+    if hits is None:
+        return COMPILED_PATTERNS[category]
+    return tuple(
+        pattern
+        for pattern, pid in zip(COMPILED_PATTERNS[category], _HS_IDS_BY_CATEGORY[category])
+        if pid in hits
+    )
+
 # Suspicious keywords by category
 KEYWORD_CATEGORIES = {
     "urgency": [
@@ -293,77 +425,135 @@ SUSPICIOUS_DOMAIN_PATTERNS = [
 ]
 
 
-def extract_upi_ids(text: str) -> List[str]:
+# per-match cleanup, compiled once. separators ([\s.-] - every unicode
+# whitespace char, all of which sit below U+3001) are dropped with a
+# translate table, a plain C loop instead of a regex sub
+_STRIP_SEPARATORS = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(0x3001)) if c.isspace()) + ".-"
+)
+# prefix word strippers - one per extractor, since the word lists differ
+_PHONE_PREFIX_RE = re.compile(r"^(?:call|contact|whatsapp|ph|phone|mobile|mob|cell|tel):?", re.I)
+_ACCOUNT_PREFIX_RE = re.compile(r"^(?:a/c|ac|account|acct):?", re.I)
+_AADHAR_PREFIX_RE = re.compile(r"^(?:aadhar|aadhaar|uid):?", re.I)
+_WHATSAPP_PREFIX_RE = re.compile(r"^(?:whatsapp|wa|watsapp):?", re.I)
+_BANK_CANDIDATE_RE = re.compile(r"\d[\d\s.-]{7}\d")
+
+_DOMAIN_RE = re.compile(r"(?:https?://)?(?:www\.)?([^/\s]+)")
+# one alternation: matching it at the start is matching any single pattern
+_SUSPICIOUS_DOMAIN_RE = re.compile("|".join(f"(?:{p})" for p in SUSPICIOUS_DOMAIN_PATTERNS))
+
+
+def _build_safe_domain_automaton():
+    """one automaton over SAFE_DOMAINS (None without pyahocorasick)"""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for safe in SAFE_DOMAINS:
+        automaton.add_word(safe, safe)
+    automaton.make_automaton()
+    return automaton
+
+
+_SAFE_DOMAIN_AUTOMATON = _build_safe_domain_automaton()
+
+
+def _is_safe_domain(domain: str) -> bool:
+    """true if any SAFE_DOMAINS entry occurs in domain"""
+    if _SAFE_DOMAIN_AUTOMATON is None:
+        return any(safe in domain for safe in SAFE_DOMAINS)
+    return next(_SAFE_DOMAIN_AUTOMATON.iter(domain), None) is not None
+
+
+def extract_upi_ids(text: str) -> Set[str]:
     """extract all UPI IDs from text"""
     upi_ids = []
-    for pattern in PATTERNS["upi_id"]:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _patterns_for("upi_id", text):
+        matches = pattern.findall(text)
         upi_ids.extend(matches)
-    return list(set(upi_ids))
+    return set(upi_ids)
 
 
-def extract_phone_numbers(text: str) -> List[str]:
+def extract_phone_numbers(text: str) -> Set[str]:
     """extract all phone numbers from text"""
     phones = []
-    for pattern in PATTERNS["phone"]:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _patterns_for("phone", text):
+        matches = pattern.findall(text)
         for m in matches:
             # clean and normalize
-            clean = re.sub(r"[\s.-]", "", m)
-            clean = re.sub(r"^(call|contact|whatsapp|ph|phone|mobile|mob|cell|tel):?", "", clean, flags=re.I)
+            clean = m.translate(_STRIP_SEPARATORS)
+            clean = _PHONE_PREFIX_RE.sub("", clean)
             clean = clean.strip()
             if len(clean) >= 10 and clean.replace("+", "").isdigit():
                 phones.append(clean)
-    return list(set(phones))
+    return set(phones)
 
 
-def extract_bank_accounts(text: str) -> List[str]:
+def extract_bank_accounts(text: str) -> Set[str]:
     """extract bank account numbers"""
+    # every account pattern needs 9 digit/separator chars that start and end
+    # on a digit - fixed width, so this can't backtrack on long digit runs
+    if not _BANK_CANDIDATE_RE.search(text):
+        return set()
+    
     accounts = []
-    for pattern in PATTERNS["bank_account"]:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _patterns_for("bank_account", text):
+        matches = pattern.findall(text)
         for m in matches:
-            clean = re.sub(r"[\s.-]", "", m)
-            clean = re.sub(r"^(a/c|ac|account|acct):?", "", clean, flags=re.I)
+            clean = m.translate(_STRIP_SEPARATORS)
+            clean = _ACCOUNT_PREFIX_RE.sub("", clean)
             # filter: 9-18 digits, not all same digit, not a phone number pattern
             if 9 <= len(clean) <= 18 and len(set(clean)) > 2:
                 # additional check: shouldn't start with 6-9 and be exactly 10 digits (phone)
                 if not (len(clean) == 10 and clean[0] in "6789"):
                     accounts.append(clean)
-    return list(set(accounts))
+    return set(accounts)
 
 
-def extract_ifsc_codes(text: str) -> List[str]:
+def extract_ifsc_codes(text: str) -> Set[str]:
     """extract IFSC codes"""
     ifsc = []
-    for pattern in PATTERNS["ifsc"]:
-        matches = re.findall(pattern, text.upper())
+    upper = text.upper()
+    for pattern in _patterns_for("ifsc", text):
+        matches = pattern.findall(upper)
         ifsc.extend(matches)
-    return list(set(ifsc))
+    return set(ifsc)
+
 
+# luhn: digit d doubled, with the two digits of the product summed
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
 
-def extract_card_numbers(text: str) -> List[str]:
+
+def _luhn_valid(number: str) -> bool:
+    """luhn checksum over a digits-only string, table-driven"""
+    digits = number[::-1]
+    total = sum(map(int, digits[0::2]))
+    total += sum(_LUHN_DOUBLED[int(d)] for d in digits[1::2])
+    return total % 10 == 0
+
+
+def extract_card_numbers(text: str) -> Set[str]:
     """extract credit/debit card numbers"""
     cards = []
-    for pattern in PATTERNS["card"]:
-        matches = re.findall(pattern, text)
+    for pattern in _patterns_for("card", text):
+        matches = pattern.findall(text)
         for m in matches:
-            clean = re.sub(r"[\s.-]", "", m)
-            # basic Luhn check could be added here
-            if len(clean) in [15, 16]:
+            clean = m.translate(_STRIP_SEPARATORS)
+            # luhn check drops random 15/16 digit runs (account numbers etc)
+            if len(clean) in [15, 16] and _luhn_valid(clean):
                 # mask middle digits for safety
                 masked = clean[:4] + "XXXX" + clean[-4:]
                 cards.append(masked)
-    return list(set(cards))
+    return set(cards)
 
 
-def extract_emails(text: str) -> List[str]:
+def extract_emails(text: str) -> Set[str]:
     """extract email addresses"""
     emails = []
-    for pattern in PATTERNS["email"]:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _patterns_for("email", text):
+        matches = pattern.findall(text)
         emails.extend([e.lower() for e in matches if "@" in str(e)])
-    return list(set(emails))
+    return set(emails)
 
 
 def extract_links(text: str) -> tuple:
@@ -371,122 +561,158 @@ def extract_links(text: str) -> tuple:
     links = []
     domains = []
     
-    for pattern in PATTERNS["link"]:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _patterns_for("link", text):
+        matches = pattern.findall(text)
         for link in matches:
             # extract domain
-            domain_match = re.search(r"(?:https?://)?(?:www\.)?([^/\s]+)", link)
+            domain_match = _DOMAIN_RE.search(link)
             if domain_match:
                 domain = domain_match.group(1).lower()
                 
                 # check if safe
-                is_safe = any(safe in domain for safe in SAFE_DOMAINS)
+                is_safe = _is_safe_domain(domain)
                 
                 # check if suspicious pattern
-                is_suspicious = any(re.match(pat, domain) for pat in SUSPICIOUS_DOMAIN_PATTERNS)
+                is_suspicious = _SUSPICIOUS_DOMAIN_RE.match(domain) is not None
                 
                 if not is_safe or is_suspicious:
                     links.append(link)
                     domains.append(domain)
     
-    return list(set(links)), list(set(domains))
+    return set(links), set(domains)
 
 
-def extract_aadhar(text: str) -> List[str]:
+def extract_aadhar(text: str) -> Set[str]:
     """extract Aadhar numbers (masked)"""
     aadhar = []
-    for pattern in PATTERNS["aadhar"]:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _patterns_for("aadhar", text):
+        matches = pattern.findall(text)
         for m in matches:
-            clean = re.sub(r"[\s.-]", "", m)
-            clean = re.sub(r"^(aadhar|aadhaar|uid):?", "", clean, flags=re.I)
+            clean = m.translate(_STRIP_SEPARATORS)
+            clean = _AADHAR_PREFIX_RE.sub("", clean)
             if len(clean) == 12 and clean.isdigit():
                 # mask for privacy: show only last 4
                 masked = "XXXX-XXXX-" + clean[-4:]
                 aadhar.append(masked)
-    return list(set(aadhar))
+    return set(aadhar)
 
 
-def extract_pan(text: str) -> List[str]:
+def extract_pan(text: str) -> Set[str]:
     """extract PAN numbers"""
     pan = []
-    for pattern in PATTERNS["pan"]:
-        matches = re.findall(pattern, text.upper())
+    upper = text.upper()
+    for pattern in _patterns_for("pan", text):
+        matches = pattern.findall(upper)
         pan.extend(matches)
-    return list(set(pan))
+    return set(pan)
 
 
-def extract_crypto(text: str) -> List[str]:
+def extract_crypto(text: str) -> Set[str]:
     """extract cryptocurrency addresses"""
     crypto = []
-    for pattern in PATTERNS["crypto"]:
-        matches = re.findall(pattern, text)
+    for pattern in _patterns_for("crypto", text):
+        matches = pattern.findall(text)
         crypto.extend(matches)
-    return list(set(crypto))
+    return set(crypto)
 
 
-def extract_amounts(text: str) -> List[str]:
+def extract_amounts(text: str) -> Set[str]:
     """extract money amounts"""
     amounts = []
-    for pattern in PATTERNS["amount"]:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _patterns_for("amount", text):
+        matches = pattern.findall(text)
         amounts.extend([m.strip() for m in matches])
-    return list(set(amounts))
+    return set(amounts)
 
 
-def extract_whatsapp(text: str) -> List[str]:
+def extract_whatsapp(text: str) -> Set[str]:
     """extract WhatsApp numbers"""
     wa = []
-    for pattern in PATTERNS["whatsapp"]:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _patterns_for("whatsapp", text):
+        matches = pattern.findall(text)
         for m in matches:
-            clean = re.sub(r"[\s.-]", "", m)
-            clean = re.sub(r"^(whatsapp|wa|watsapp|whatsapp):?", "", clean, flags=re.I)
+            clean = m.translate(_STRIP_SEPARATORS)
+            clean = _WHATSAPP_PREFIX_RE.sub("", clean)
             if clean:
                 wa.append(clean)
-    return list(set(wa))
+    return set(wa)
+
 
+# "I am X", "name is X", "this is X calling"...
+_NAME_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"(?:my name is|i am|this is|myself|i'm)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
+        r"(?:name|naam)[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
+        r"(?:mr\.|mrs\.|ms\.|shri|smt\.?)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
+        r"(?:from|calling from)\s+(?:bank|sbi|hdfc|icici)[\s,]+(?:my name is\s+)?([A-Z][a-z]+)",
+    )
+)
+
+_NAME_FALSE_POSITIVES = frozenset({
+    "Sir", "Madam", "Dear", "Customer", "Account", "Bank", "The", "This", "Your",
+})
 
-def extract_names(text: str) -> List[str]:
+
+def extract_names(text: str) -> Set[str]:
     """
     extract potential names using heuristics
     looks for patterns like "I am X", "name is X", "this is X calling"
     """
     names = []
     
-    name_patterns = [
-        r"(?:my name is|i am|this is|myself|i'm)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
-        r"(?:name|naam)[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
-        r"(?:mr\.|mrs\.|ms\.|shri|smt\.?)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
-        r"(?:from|calling from)\s+(?:bank|sbi|hdfc|icici)[\s,]+(?:my name is\s+)?([A-Z][a-z]+)",
-    ]
-    
-    for pattern in name_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _NAME_PATTERNS:
+        matches = pattern.findall(text)
         for m in matches:
             name = m.strip()
             # filter out common false positives
-            false_positives = ["Sir", "Madam", "Dear", "Customer", "Account", "Bank", "The", "This", "Your"]
-            if name and name not in false_positives and len(name) > 2:
+            if name and name not in _NAME_FALSE_POSITIVES and len(name) > 2:
                 names.append(name.title())
     
-    return list(set(names))
+    return set(names)
+
+
+def _build_keyword_automaton():
+    """one automaton over every keyword; values are (category, keyword) pairs"""
+    if ahocorasick is None:
+        return None
+    
+    owners = {}
+    for category, kw_list in KEYWORD_CATEGORIES.items():
+        for kw in kw_list:
+            owners.setdefault(kw.lower(), []).append((category, kw))
+    
+    automaton = ahocorasick.Automaton()
+    for needle, pairs in owners.items():
+        automaton.add_word(needle, tuple(pairs))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
 
 
 def extract_keywords(text: str) -> tuple:
     """extract suspicious keywords and categorize them"""
     text_lower = text.lower()
-    keywords = []
-    categories = []
+    keywords = set()
+    categories = set()
+    
+    if _KEYWORD_AUTOMATON is not None:
+        # one pass over the text instead of a substring scan per keyword
+        for _, pairs in _KEYWORD_AUTOMATON.iter(text_lower):
+            for category, kw in pairs:
+                keywords.add(kw)
+                categories.add(category)
+        return keywords, categories
     
     for category, kw_list in KEYWORD_CATEGORIES.items():
         for kw in kw_list:
             if kw.lower() in text_lower:
-                keywords.append(kw)
-                if category not in categories:
-                    categories.append(category)
+                keywords.add(kw)
+                categories.add(category)
     
-    return list(set(keywords)), categories
+    return keywords, categories
 
 
 def calculate_risk_score(intel: ExtractedIntel) -> int:
@@ -547,6 +773,33 @@ def determine_scam_type(tactics: List[str], keywords: List[str]) -> str:
     return "GENERAL_SCAM"
 
 
+# every value determine_scam_type can return
+_SCAM_TYPES = (
+    "KYC_SCAM", "LOTTERY_SCAM", "ACCOUNT_FREEZE_SCAM", "LEGAL_THREAT_SCAM",
+    "REFUND_SCAM", "CREDENTIAL_PHISHING", "PHISHING_LINK_SCAM", "GENERAL_SCAM",
+)
+
+# keywords/tactics/scam types come from a fixed vocabulary. extractions done
+# in-process already share these objects; results unpickled from the worker
+# pool are mapped back onto them so stored intel doesn't hold copies
+_INTERNED = {
+    sys.intern(token): sys.intern(token)
+    for token in (
+        *KEYWORD_CATEGORIES,
+        *(kw for kw_list in KEYWORD_CATEGORIES.values() for kw in kw_list),
+        *_SCAM_TYPES,
+    )
+}
+
+
+def _intern_vocabulary(intel: ExtractedIntel) -> ExtractedIntel:
+    """swap keyword/tactic/scam type strings for the shared module copies"""
+    intel.suspicious_keywords = {_INTERNED.get(kw, kw) for kw in intel.suspicious_keywords}
+    intel.tactics_detected = {_INTERNED.get(t, t) for t in intel.tactics_detected}
+    intel.scam_type = _INTERNED.get(intel.scam_type, intel.scam_type)
+    return intel
+
+
 def extract_from_text(text: str) -> ExtractedIntel:
     """
     MAIN FUNCTION: extract all intel from a single message
@@ -581,19 +834,28 @@ def extract_from_text(text: str) -> ExtractedIntel:
     return intel
 
 
+# joins messages so a conversation is scanned in one pass. nothing can
+# match across it: links stop at whitespace and "<", digit groups allow at
+# most one separator char, and every prefixed pattern needs a digit or
+# letter after its [\s:]* run
+_MESSAGE_SEP = " < "
+
+
 def extract_from_conversation(messages: List[Dict]) -> ExtractedIntel:
     """
     extract intel from entire conversation history
     """
-    combined = ExtractedIntel()
+    texts = [text for text in (msg.get("text", "") for msg in messages) if text]
+    if not texts:
+        return ExtractedIntel()
     
-    for msg in messages:
-        text = msg.get("text", "")
-        intel = extract_from_text(text)
-        combined.merge(intel)
+    # one pass over the joined text - risk score is computed on the result
+    combined = extract_from_text(_MESSAGE_SEP.join(texts))
     
-    # recalculate after merging
-    combined.risk_score = calculate_risk_score(combined)
+    # scam type comes from the first message, as when merging per message
+    if len(texts) > 1:
+        keywords, tactics = extract_keywords(texts[0])
+        combined.scam_type = determine_scam_type(tactics, keywords)
     
     return combined
 
@@ -618,22 +880,22 @@ def generate_agent_notes(intel: ExtractedIntel, scam_result: Dict = None) -> str
     
     # tactics used
     if intel.tactics_detected:
-        notes.append(f"Tactics: {', '.join(intel.tactics_detected)}")
+        notes.append(f"Tactics: {', '.join(sorted(intel.tactics_detected))}")
     
     # what was collected
     collected = []
     if intel.upi_ids:
-        collected.append(f"{len(set(intel.upi_ids))} UPI ID(s): {', '.join(list(set(intel.upi_ids))[:3])}")
+        collected.append(f"{len(intel.upi_ids)} UPI ID(s): {', '.join(list(intel.upi_ids)[:3])}")
     if intel.phone_numbers:
-        collected.append(f"{len(set(intel.phone_numbers))} phone(s)")
+        collected.append(f"{len(intel.phone_numbers)} phone(s)")
     if intel.email_addresses:
-        collected.append(f"{len(set(intel.email_addresses))} email(s)")
+        collected.append(f"{len(intel.email_addresses)} email(s)")
     if intel.bank_accounts:
-        collected.append(f"{len(set(intel.bank_accounts))} account(s)")
+        collected.append(f"{len(intel.bank_accounts)} account(s)")
     if intel.phishing_links:
-        collected.append(f"{len(set(intel.phishing_links))} link(s)")
+        collected.append(f"{len(intel.phishing_links)} link(s)")
     if intel.names:
-        collected.append(f"Names: {', '.join(list(set(intel.names))[:3])}")
+        collected.append(f"Names: {', '.join(list(intel.names)[:3])}")
     
     if collected:
         notes.append("Extracted: " + "; ".join(collected))
@@ -641,6 +903,58 @@ def generate_agent_notes(intel: ExtractedIntel, scam_result: Dict = None) -> str
     return ". ".join(notes) if notes else "Scam attempt detected - gathering more intel"
 
 
+# =============================================================
+# ASYNC WRAPPERS - keep big extractions off the event loop
+# =============================================================
+
+# texts at least this long go to a worker process. shorter ones run inline:
+# re holds the GIL, so a thread hop wouldn't free the loop anyway and
+# pickling to a process costs more than the regex work itself
+PROCESS_POOL_THRESHOLD = 4096
+
+# workers per web worker process - gunicorn runs several of those, so the
+# pool stays small instead of spawning cpu_count interpreters in each
+EXTRACTION_POOL_WORKERS = max(1, int(os.getenv("INTEL_POOL_WORKERS", "2")))
+
+_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """lazily start the extraction pool (spawn - the app has live threads)"""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(
+            max_workers=EXTRACTION_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _POOL
+
+
+async def extract_from_text_async(text: str) -> ExtractedIntel:
+    """extract_from_text, in a worker process for large texts"""
+    if not text or len(text) < PROCESS_POOL_THRESHOLD:
+        return extract_from_text(text)
+    loop = asyncio.get_running_loop()
+    return _intern_vocabulary(await loop.run_in_executor(_get_pool(), extract_from_text, text))
+
+
+async def extract_from_conversation_async(messages: List[Dict]) -> ExtractedIntel:
+    """extract_from_conversation, in a worker process for long conversations"""
+    total = sum(len(msg.get("text", "")) for msg in messages)
+    if total < PROCESS_POOL_THRESHOLD:
+        return extract_from_conversation(messages)
+    loop = asyncio.get_running_loop()
+    return _intern_vocabulary(await loop.run_in_executor(_get_pool(), extract_from_conversation, messages))
+
+
+def shutdown_extraction_pool():
+    """stop the worker processes (app shutdown)"""
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+
 # =============================================================
 # TEST
 # =============================================================
@@ -16,33 +16,47 @@ endpoints:
 - GET /api/scammers - known scammer fingerprints
 """
 
+import asyncio
+
 from fastapi import FastAPI, HTTPException, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
 
 from app.config import API_SECRET_KEY
 from app.scam_detector import detect_scam, analyze_conversation
-from app.intelligence import extract_from_text, extract_from_conversation, generate_agent_notes
+from app.intelligence import (
+    extract_from_text_async, extract_from_conversation_async,
+    generate_agent_notes, shutdown_extraction_pool
+)
 from app.session_manager import session_store
 from app.agent import get_agent_response
+from app.factual_answers import get_humanized_factual_answer_async, close_http_client
 from app.automation import automation
+from app.guvi_callback import shutdown_callbacks
 from app.language_detector import detect_language, get_language_name
-from app.image_generator import check_image_request, generate_image_for_request, image_gen
+from app.image_generator import (
+    check_image_request, generate_image_for_request, image_gen,
+    schedule_prewarm, close_image_client
+)
 from app.smart_tactics import get_tactical_response, advance_conversation, get_stage
 
+try:
+    import orjson
+except ImportError:  # optional: responses go through stdlib json
+    orjson = None
+
 # NEW MODULES - v3.5
 from app.fake_identity import get_fake_identity
 from app.scam_classifier import classify_scam, get_tactics_for_scam
 from app.time_metrics import time_tracker
-from app.emotional_state import EmotionalContext, emotion_manager
+from app.emotional_state import emotion_manager
 from app.scammer_fingerprint import scammer_db
 from app.alert_webhooks import alert_new_session, alert_intel_extracted, alert_repeat_scammer
 
-# track emotional states per session
-emotional_states: dict = {}
+# emotional states per session live in emotion_manager (bounded LRU)
 # track fake identities per session (using module's cache is automatic)
 
 
@@ -96,6 +110,8 @@ AI-powered scam detection and engagement system.
 - 1000 requests/hour per IP
     """,
     version="4.0.0",
+    # orjson renders the list-heavy intel/session payloads much faster
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_tags=[
@@ -123,36 +139,33 @@ app.add_middleware(
 )
 
 # Add custom middleware
-from app.core.middleware import (
-    RateLimitMiddleware,
-    RequestLoggingMiddleware,
-    SecurityHeadersMiddleware
-)
-
-# Security headers (outermost - runs first on response)
-app.add_middleware(SecurityHeadersMiddleware)
-
-# Request logging
-app.add_middleware(RequestLoggingMiddleware, log_body=False)
+from app.core.middleware import UnifiedMiddleware
 
-# Rate limiting (innermost - runs first on request)
+# Rate limiting, request logging and security headers in one ASGI hop
 app.add_middleware(
-    RateLimitMiddleware,
+    UnifiedMiddleware,
     requests_per_minute=60,
     requests_per_hour=1000
 )
 
 
 # --- MongoDB Connection ---
+_usage_flush_task: Optional[asyncio.Task] = None
+
+
 @app.on_event("startup")
 async def startup_db():
     """Connect to MongoDB on startup"""
+    global _usage_flush_task
     try:
         from app.db.mongodb import connect_to_mongodb
         from app.services.subscription_service import SubscriptionService
+        from app.services.api_key_service import APIKeyService
         await connect_to_mongodb()
         # Initialize default subscription plans
         await SubscriptionService.initialize_default_plans()
+        # Periodically persist buffered API key usage
+        _usage_flush_task = asyncio.create_task(APIKeyService.run_usage_flusher())
         print("[API] Database connected and initialized")
     except Exception as e:
         print(f"[API] Warning: Could not connect to MongoDB: {e}")
@@ -164,11 +177,28 @@ async def shutdown_db():
     """Close MongoDB connection on shutdown"""
     try:
         from app.db.mongodb import close_mongodb_connection
+        from app.db.models.api_key import APIKey
+        if _usage_flush_task:
+            _usage_flush_task.cancel()
+            # Drain whatever usage is still buffered
+            try:
+                await APIKey.flush_usage()
+            except Exception as e:
+                print(f"[API KEYS] Final usage flush failed: {e}")
         await close_mongodb_connection()
     except Exception:
         pass
 
 
+@app.on_event("shutdown")
+async def shutdown_http_clients():
+    """Close shared outbound HTTP clients and worker pools"""
+    await close_http_client()
+    await close_image_client()
+    await asyncio.to_thread(shutdown_callbacks)
+    shutdown_extraction_pool()
+
+
 # --- Include API v1 Router ---
 from app.api.v1.router import api_router
 app.include_router(api_router, prefix="/api/v1")
@@ -241,7 +271,7 @@ async def get_session(session_id: str, api_key: str = Depends(verify_api_key)):
     identity_dict = identity.to_dict() if identity else None
     
     # get emotional state
-    emotion = emotional_states.get(session_id)
+    emotion = emotion_manager.get(session_id)
     emotional_info = {
         "state": emotion.current_state.value,
         "transitions": emotion.transition_count,
@@ -276,7 +306,7 @@ async def force_callback(session_id: str, api_key: str = Depends(verify_api_key)
     if session.callback_sent:
         return {"status": "already_sent", "message": "callback was already sent"}
     
-    result = automation.process_callback(session)
+    result = await asyncio.wrap_future(automation.queue_callback(session))
     return {"status": "success" if result.get("success") else "failed", "result": result}
 
 
@@ -366,9 +396,7 @@ async def handle_message(request: MessageRequest, api_key: str = Depends(verify_
     identity = get_fake_identity(request.sessionId)
     
     # initialize emotional state for session
-    if request.sessionId not in emotional_states:
-        emotional_states[request.sessionId] = EmotionalContext(session_id=request.sessionId)
-    emotion = emotional_states[request.sessionId]
+    emotion = emotion_manager.get_or_create(request.sessionId)
     
     # 3. sync conversation history from request
     if request.conversationHistory:
@@ -417,7 +445,7 @@ async def handle_message(request: MessageRequest, api_key: str = Depends(verify_
             alert_new_session(request.sessionId, request.message.text, scam_type)
     
     # 7. check for repeat scammer (based on extracted intel)
-    temp_intel = extract_from_text(request.message.text)
+    temp_intel = await extract_from_text_async(request.message.text)
     repeat_check = scammer_db.check_fingerprint(temp_intel.to_dict())
     
     if repeat_check.get("is_known"):
@@ -450,6 +478,9 @@ async def handle_message(request: MessageRequest, api_key: str = Depends(verify_
             image_url = img_result["image_url"]
             image_type = img_result["type"]
             print(f"[IMAGE] Generated: {image_type}")
+            
+            # render it on pollinations while we write the reply
+            schedule_prewarm([image_url])
     
     # 10. generate response
     if session.scam_detected:
@@ -477,11 +508,17 @@ async def handle_message(request: MessageRequest, api_key: str = Depends(verify_
         metadata_dict["scam_type"] = scam_type
         metadata_dict["recommended_tactics"] = scam_tactics[:2] if scam_tactics else []
         
-        reply = get_agent_response(
-            conversation_history=history,
-            latest_message=request.message.text,
-            metadata=metadata_dict
-        )
+        # factual questions: DuckDuckGo/Wikipedia raced without blocking the loop
+        reply = await get_humanized_factual_answer_async(request.message.text)
+        if reply:
+            print(f"[AGENT] Using factual answer (FREE API)")
+        else:
+            reply = get_agent_response(
+                conversation_history=history,
+                latest_message=request.message.text,
+                metadata=metadata_dict,
+                check_factual=False
+            )
         
         # if sending image, append image context to reply
         if image_url and image_type:
@@ -530,8 +567,8 @@ async def handle_message(request: MessageRequest, api_key: str = Depends(verify_
     time_tracker.add_message(request.sessionId, is_scammer=False)
     
     # 11. extract intelligence
-    session.intel = extract_from_conversation(session.conversation)
-    latest_intel = extract_from_text(request.message.text)
+    session.intel = await extract_from_conversation_async(session.conversation)
+    latest_intel = await extract_from_text_async(request.message.text)
     session.intel.merge(latest_intel)
     
     # fingerprint the scammer
@@ -547,10 +584,10 @@ async def handle_message(request: MessageRequest, api_key: str = Depends(verify_
         alert_intel_extracted(request.sessionId, intel_dict)
     
     # 12. check if we should send callback (using automation)
+    # sent in the background so the reply isn't held up by guvi
     if automation.should_send_callback(session):
-        result = automation.process_callback(session)
-        if result.get("success"):
-            print(f"[CALLBACK] Sent for session {session.session_id}")
+        automation.queue_callback(session)
+        print(f"[CALLBACK] Queued for session {session.session_id}")
     
     # 13. return response with optional image
     return MessageResponse(
@@ -9,8 +9,8 @@ import re
 from app.core.validators import (
     PasswordValidator,
     EmailValidator,
-    PhoneValidator,
-    validate_password_strength
+    validate_password_strength,
+    validate_indian_phone,
 )
 
 
@@ -42,12 +42,7 @@ class UserRegister(BaseModel):
     @classmethod
     def validate_phone(cls, v):
         """Validate and normalize phone number."""
-        if v:
-            is_valid, error = PhoneValidator.validate_indian(v)
-            if not is_valid:
-                raise ValueError(error)
-            return PhoneValidator.normalize(v)
-        return v
+        return validate_indian_phone(v)
     
     class Config:
         json_schema_extra = {
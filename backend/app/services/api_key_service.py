@@ -2,6 +2,7 @@
 api_key_service.py - Service for managing API keys with database persistence
 """
 
+import asyncio
 from typing import Optional, List
 from datetime import datetime, timedelta
 from beanie import PydanticObjectId
@@ -68,10 +69,12 @@ class APIKeyService:
         # Hash the provided key
         key_hash = APIKey.hash_key(raw_key)
         
-        # Find the key by hash
-        api_key = await APIKey.find_one(APIKey.key_hash == key_hash)
+        # Find the key by hash (legacy documents hold the hex form)
+        api_key = await APIKey.find_one(
+            {"key_hash": {"$in": [key_hash, key_hash.hex()]}}
+        )
         
-        if not api_key:
+        if not api_key or not APIKey.verify(raw_key, api_key.key_hash):
             return None
         
         if not api_key.is_valid():
@@ -191,5 +194,16 @@ class APIKeyService:
         return len(expired_keys)
 
 
+    @staticmethod
+    async def run_usage_flusher(interval_seconds: float = 5.0):
+        """Flush buffered API key usage every interval (background task)."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await APIKey.flush_usage()
+            except Exception as e:
+                print(f"[API KEYS] Usage flush failed: {e}")
+
+
 # Singleton instance
 api_key_service = APIKeyService()
@@ -5,7 +5,15 @@ auth_service.py - Authentication business logic
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
-from app.db.models.user import User, UserRole
+from beanie import PydanticObjectId
+
+from app.db.models.user import (
+    User,
+    UserRole,
+    ActiveUserView,
+    ResetTokenView,
+    VerificationStatusView,
+)
 from app.db.models.user_settings import UserSettings
 from app.db.models.subscription import Subscription, PlanTier, SubscriptionStatus
 from app.db.models.token_blacklist import TokenBlacklist
@@ -52,6 +60,7 @@ class AuthService:
             phone=data.phone,
             verification_token=generate_verification_token(),
             verification_token_expires=datetime.utcnow() + timedelta(hours=24),
+            active_tier=PlanTier.FREE,
         )
         await user.insert()
         
@@ -135,7 +144,9 @@ class AuthService:
             raise ValueError("Invalid token payload")
         
         # Verify user exists and is active
-        user = await User.get(user_id)
+        user = await User.find_one(
+            User.id == PydanticObjectId(user_id)
+        ).project(ActiveUserView)
         if not user or not user.is_active:
             raise ValueError("User not found or inactive")
         
@@ -182,19 +193,26 @@ class AuthService:
         Raises:
             ValueError: If token is invalid or expired
         """
-        user = await User.find_one(User.reset_token == token)
+        user = await User.find_one(User.reset_token == token).project(ResetTokenView)
         if not user:
             raise ValueError("Invalid reset token")
         
         if user.reset_token_expires < datetime.utcnow():
             raise ValueError("Reset token has expired")
         
-        # Update password
-        user.password_hash = hash_password(new_password)
-        user.reset_token = None
-        user.reset_token_expires = None
-        user.update_timestamp()
-        await user.save()
+        # Update password (token in the filter keeps it single-use)
+        result = await User.find_one(User.id == user.id, User.reset_token == token).update({
+            "$set": {
+                "password_hash": hash_password(new_password),
+                "reset_token": None,
+                "reset_token_expires": None,
+                "updated_at": datetime.utcnow(),
+            }
+        })
+        
+        # A concurrent reset with the same token already consumed it
+        if not result.modified_count:
+            raise ValueError("Invalid reset token")
     
     @staticmethod
     async def verify_email(token: str) -> User:
@@ -337,7 +355,9 @@ class AuthService:
         Returns:
             Dictionary with verification status
         """
-        user = await User.get(user_id)
+        user = await User.find_one(
+            User.id == PydanticObjectId(user_id)
+        ).project(VerificationStatusView)
         if not user:
             raise ValueError("User not found")
         
@@ -377,6 +377,7 @@ class OAuthService:
                     auth_provider=provider,
                     oauth_id=user_info.oauth_id,
                     is_verified=True,  # OAuth emails are pre-verified
+                    active_tier=PlanTier.FREE,
                 )
                 await user.insert()
                 
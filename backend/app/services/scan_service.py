@@ -20,7 +20,7 @@ from app.schemas.scan import (
 
 # Import existing scam detection
 from app.scam_detector import detect_scam
-from app.intelligence import extract_from_text
+from app.intelligence import extract_from_text_async
 
 
 class ScanService:
@@ -62,7 +62,7 @@ class ScanService:
         indicators = detection_result.get("indicators", [])
         
         # Extract entities using existing intelligence module
-        intel = extract_from_text(data.message_text)
+        intel = await extract_from_text_async(data.message_text)
         
         # Determine risk level
         risk_level = ScanService._calculate_risk_level(confidence)
@@ -95,7 +95,7 @@ class ScanService:
             extracted_phones=intel.phones if hasattr(intel, 'phones') else [],
             extracted_emails=intel.emails if hasattr(intel, 'emails') else [],
             extracted_urls=intel.urls if hasattr(intel, 'urls') else [],
-            extracted_upis=intel.upi_ids if hasattr(intel, 'upi_ids') else [],
+            extracted_upis=list(intel.upi_ids) if hasattr(intel, 'upi_ids') else [],
             auto_blocked=auto_blocked,
         )
         await scan.insert()
@@ -64,6 +64,16 @@ class SessionService:
         await session.save()
         return session
     
+    @staticmethod
+    async def add_messages_bulk(
+        session_id: str,
+        messages: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Append several messages to an existing session in one round trip.
+        """
+        await HoneypotSession.append_messages(session_id, messages)
+    
     @staticmethod
     async def update_scam_info(
         session_id: str,
@@ -208,7 +218,7 @@ class SessionService:
         if not session:
             return None
         
-        return session.messages
+        return session.message_list
     
     @staticmethod
     async def get_history_for_prompt(
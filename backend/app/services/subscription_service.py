@@ -5,7 +5,10 @@ subscription_service.py - Subscription management business logic
 from datetime import datetime, timedelta
 from typing import Optional, List
 
+from beanie import PydanticObjectId
+
 from app.db.models.subscription import Subscription, Plan, PlanTier, SubscriptionStatus
+from app.db.models.user import User
 from app.schemas.subscription import (
     PlanResponse,
     PlanListResponse,
@@ -19,6 +22,17 @@ class SubscriptionService:
     Service for subscription and plan management.
     """
     
+    @staticmethod
+    async def _sync_user_tier(user_id: str, tier: PlanTier):
+        """
+        Mirror the active subscription tier onto the user document.
+        """
+        # Targeted $set - a full save() would overwrite concurrent writes
+        await User.find_one(
+            User.id == PydanticObjectId(user_id),
+            User.active_tier != tier
+        ).update({"$set": {"active_tier": tier.value}})
+    
     @staticmethod
     async def initialize_default_plans():
         """
@@ -187,6 +201,8 @@ class SubscriptionService:
             )
             await subscription.insert()
         
+        await SubscriptionService._sync_user_tier(user_id, plan.tier)
+        
         return SubscriptionResponse(
             id=str(subscription.id),
             plan_name=plan.name,
@@ -230,6 +246,8 @@ class SubscriptionService:
         )
         await new_subscription.insert()
         
+        await SubscriptionService._sync_user_tier(user_id, PlanTier.FREE)
+        
         return True
     
     @staticmethod
@@ -60,7 +60,13 @@ class UserService:
         Get user settings.
         """
         settings = await UserSettings.get_or_create(user_id)
-        
+        return UserService._settings_response(settings)
+    
+    @staticmethod
+    def _settings_response(settings: UserSettings) -> UserSettingsResponse:
+        """
+        Build the settings response schema.
+        """
         return UserSettingsResponse(
             email_alerts=settings.email_alerts,
             sms_alerts=settings.sms_alerts,
@@ -81,7 +87,11 @@ class UserService:
         """
         Update user settings.
         """
-        settings = await UserSettings.get_or_create(user_id)
+        # Update a freshly loaded document - the cached instance is shared
+        # with other requests and must not be mutated in place
+        settings = await UserSettings.find_one(UserSettings.user_id == user_id)
+        if not settings:
+            settings = UserSettings(user_id=user_id)
         
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
@@ -91,7 +101,9 @@ class UserService:
         settings.updated_at = datetime.utcnow()
         await settings.save()
         
-        return await UserService.get_user_settings(user_id)
+        # Cache only once saved, so concurrent readers never get ahead of Mongo
+        UserSettings.cache(settings)
+        return UserService._settings_response(settings)
     
     @staticmethod
     async def get_user_stats(user_id: str) -> UserStatsResponse:
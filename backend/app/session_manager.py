@@ -19,7 +19,7 @@ from dataclasses import dataclass, field
 from app.intelligence import ExtractedIntel
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     session_id: str
     created_at: datetime = field(default_factory=datetime.utcnow)
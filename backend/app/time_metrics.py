@@ -18,7 +18,7 @@ from typing import Dict, Optional, List
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMetrics:
     """engagement metrics for a session"""
     
@@ -398,7 +398,7 @@ class TestSecurityHeaders:
         response = await client.get("/api/v1/health")
         headers = response.headers
         
-        # These should be present from SecurityHeadersMiddleware
+        # These should be present from UnifiedMiddleware
         expected_headers = [
             "X-Content-Type-Options",
             "X-Frame-Options",
@@ -0,0 +1,87 @@
+# ===========================================
+# ScamShield Intelligence Extraction Tests
+# ===========================================
+# Run with: pytest tests/test_intelligence.py -v
+# ===========================================
+
+import json
+
+from app.intelligence import (
+    ExtractedIntel,
+    _luhn_valid,
+    extract_card_numbers,
+    extract_from_conversation,
+)
+
+
+# ===========================================
+# EXTRACTED INTEL COLLECTIONS
+# ===========================================
+
+class TestExtractedIntel:
+    """Tests for the set-typed ExtractedIntel collections."""
+
+    def test_merge_dedupes(self):
+        intel = ExtractedIntel(upi_ids={"scammer@paytm"}, phone_numbers={"9876543210"})
+        other = ExtractedIntel(upi_ids={"scammer@paytm", "fraud@ybl"}, risk_score=70)
+
+        intel.merge(other)
+
+        assert intel.upi_ids == {"scammer@paytm", "fraud@ybl"}
+        assert intel.phone_numbers == {"9876543210"}
+        assert intel.risk_score == 70
+
+    def test_merge_does_not_alias_other(self):
+        intel = ExtractedIntel()
+        other = ExtractedIntel(upi_ids={"scammer@paytm"})
+
+        intel.merge(other)
+        intel.upi_ids.add("fraud@ybl")
+
+        assert other.upi_ids == {"scammer@paytm"}
+
+    def test_to_dict_returns_lists(self):
+        intel = ExtractedIntel(upi_ids={"scammer@paytm"}, suspicious_keywords={"otp"})
+        data = intel.to_dict()
+
+        assert data["upiIds"] == ["scammer@paytm"]
+        assert data["suspiciousKeywords"] == ["otp"]
+        assert all(not isinstance(value, set) for value in data.values())
+        assert json.loads(intel.to_json_bytes())["upiIds"] == ["scammer@paytm"]
+
+    def test_intel_count_counts_unique_values(self):
+        intel = ExtractedIntel(upi_ids={"scammer@paytm"})
+        intel.merge(ExtractedIntel(upi_ids={"scammer@paytm"}, phone_numbers={"9876543210"}))
+
+        assert intel.get_intel_count() == 2
+
+    def test_repeated_values_across_messages_count_once(self):
+        intel = extract_from_conversation([
+            {"sender": "scammer", "text": "pay to scammer@paytm now"},
+            {"sender": "scammer", "text": "i said scammer@paytm, hurry"},
+        ])
+
+        assert intel.upi_ids == {"scammer@paytm"}
+
+
+# ===========================================
+# CARD NUMBERS
+# ===========================================
+
+class TestCardNumbers:
+    """Tests for Luhn-filtered card number extraction."""
+
+    def test_luhn_valid(self):
+        assert _luhn_valid("4111111111111111")
+        assert _luhn_valid("5500005555555559")
+        assert _luhn_valid("378282246310005")
+        assert not _luhn_valid("4111111111111112")
+        assert not _luhn_valid("1234567812345678")
+
+    def test_valid_card_is_masked(self):
+        assert extract_card_numbers("card 4111 1111 1111 1111 exp 12/28") == {"4111XXXX1111"}
+        assert extract_card_numbers("amex 3782-822463-10005") == {"3782XXXX0005"}
+
+    def test_non_luhn_digit_runs_are_dropped(self):
+        assert extract_card_numbers("account 1234 5678 1234 5678") == set()
+        assert extract_card_numbers("card 4111-1111-1111-1112") == set()
@@ -0,0 +1,256 @@
+# ===========================================
+# ScamShield Document Model Tests
+# ===========================================
+# Run with: pytest tests/test_models.py -v
+# No database needed - collection access is faked per test
+# ===========================================
+
+import hashlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.db.models.api_key import APIKey
+from app.db.models.session import HoneypotSession
+from app.services.api_key_service import APIKeyService
+
+
+# ===========================================
+# FIXTURES
+# ===========================================
+
+class FakeCollection:
+    """Records update_one calls; matched_count is what the server reports."""
+
+    def __init__(self):
+        self.matched_count = 1
+        self.updates = []
+        self.inserts = []
+        self.write_concern = None
+
+    def with_options(self, write_concern=None):
+        self.write_concern = write_concern
+        return self
+
+    async def update_one(self, filter, update):
+        self.updates.append((filter, update))
+        return SimpleNamespace(matched_count=self.matched_count)
+
+    async def insert_many(self, documents, ordered=True):
+        self.inserts.append((documents, ordered))
+        return SimpleNamespace(inserted_ids=[doc["_id"] for doc in documents])
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    """Stand-in for the motor collection (init_beanie is never called)."""
+    fake = FakeCollection()
+    for model in (HoneypotSession, APIKey):
+        monkeypatch.setattr(model, "get_motor_collection", classmethod(lambda cls: fake))
+    return fake
+
+
+@pytest.fixture
+def legacy_session(collection):
+    """A session as stored before messages went column-wise."""
+    return HoneypotSession.model_validate({
+        "session_id": "legacy-1",
+        "messages": [
+            {"sender": "scammer", "text": "send otp", "timestamp": "2024-01-01T00:00:00Z"},
+        ],
+        "total_messages": 1,
+        "scammer_messages": 1,
+    })
+
+
+RAW_KEY = "sk_live_test-key"
+
+
+@pytest.fixture
+def legacy_api_key(collection):
+    """An API key stored before key_hash moved from hex text to raw bytes."""
+    return APIKey.model_validate({
+        "user_id": "user-1",
+        "key": "sk_live_test...-key",
+        "key_hash": hashlib.sha256(RAW_KEY.encode("utf-8")).hexdigest(),
+    })
+
+
+# ===========================================
+# HONEYPOT SESSION APPEND
+# ===========================================
+
+class TestAppendMessages:
+    """Tests for HoneypotSession.append_messages on both document shapes."""
+
+    BURST = [
+        {"sender": "agent", "text": "which otp?", "timestamp": "2024-01-01T00:00:05Z"},
+        {"sender": "scammer", "text": "the bank one"},
+    ]
+
+    async def test_column_shape_uses_single_push(self, collection, monkeypatch):
+        find_one = AsyncMock()
+        monkeypatch.setattr(HoneypotSession, "find_one", find_one)
+
+        await HoneypotSession.append_messages("s1", self.BURST)
+
+        assert len(collection.updates) == 1
+        filter, update = collection.updates[0]
+        # Legacy list-shaped documents must not match the $push
+        assert filter == {"session_id": "s1", "messages": {"$not": {"$type": "array"}}}
+        assert update["$push"]["messages.sender"] == {"$each": ["agent", "scammer"]}
+        assert update["$push"]["messages.text"] == {"$each": ["which otp?", "the bank one"]}
+        assert update["$inc"] == {"total_messages": 2, "scammer_messages": 1, "agent_messages": 1}
+        find_one.assert_not_awaited()
+
+    async def test_legacy_shape_is_migrated_on_save(self, collection, legacy_session, monkeypatch):
+        collection.matched_count = 0
+        monkeypatch.setattr(HoneypotSession, "find_one", AsyncMock(return_value=legacy_session))
+        save = AsyncMock()
+        monkeypatch.setattr(HoneypotSession, "save", save)
+
+        await HoneypotSession.append_messages("legacy-1", self.BURST)
+
+        HoneypotSession.find_one.assert_awaited_once_with({"session_id": "legacy-1"})
+        save.assert_awaited_once()
+        assert legacy_session.messages["sender"] == ["scammer", "agent", "scammer"]
+        assert legacy_session.messages["text"] == ["send otp", "which otp?", "the bank one"]
+        assert legacy_session.messages["timestamp"][1] == "2024-01-01T00:00:05Z"
+        assert legacy_session.total_messages == 3
+        assert legacy_session.scammer_messages == 2
+        assert legacy_session.agent_messages == 1
+
+    async def test_missing_session_is_a_no_op(self, collection, monkeypatch):
+        collection.matched_count = 0
+        monkeypatch.setattr(HoneypotSession, "find_one", AsyncMock(return_value=None))
+        save = AsyncMock()
+        monkeypatch.setattr(HoneypotSession, "save", save)
+
+        await HoneypotSession.append_messages("missing", self.BURST)
+
+        save.assert_not_awaited()
+
+    async def test_empty_burst_skips_the_database(self, collection):
+        await HoneypotSession.append_messages("s1", [])
+
+        assert collection.updates == []
+
+
+# ===========================================
+# BULK INSERT
+# ===========================================
+
+class TestBulkInsert:
+    """Tests for BulkInsertMixin.bulk_insert batching."""
+
+    async def test_unordered_acknowledged_batches(self, collection):
+        sessions = [HoneypotSession(session_id=f"s{i}") for i in range(5)]
+
+        assert await HoneypotSession.bulk_insert(sessions, batch_size=2) == 5
+
+        assert [len(docs) for docs, _ in collection.inserts] == [2, 2, 1]
+        assert all(ordered is False for _, ordered in collection.inserts)
+        assert collection.write_concern.document == {"w": 1}
+        # Ids are assigned client-side and written back
+        assert [doc["_id"] for docs, _ in collection.inserts for doc in docs] == [s.id for s in sessions]
+        assert collection.inserts[0][0][1]["session_id"] == "s1"
+
+    async def test_empty_list_skips_the_database(self, collection):
+        assert await HoneypotSession.bulk_insert([]) == 0
+        assert collection.inserts == []
+
+
+# ===========================================
+# HONEYPOT SESSION MESSAGES
+# ===========================================
+
+class TestSessionMessages:
+    """Tests for the column-wise HoneypotSession.messages storage."""
+
+    def test_new_session_has_empty_columns(self, collection):
+        session = HoneypotSession(session_id="s1")
+
+        assert session.messages == {"sender": [], "text": [], "timestamp": [], "metadata": []}
+        assert session.message_count == 0
+        assert session.message_list == []
+
+    def test_legacy_list_is_converted_to_columns(self, legacy_session):
+        assert legacy_session.messages == {
+            "sender": ["scammer"],
+            "text": ["send otp"],
+            "timestamp": ["2024-01-01T00:00:00Z"],
+            "metadata": [{}],
+        }
+        assert legacy_session.message_count == 1
+
+    def test_add_message_appends_to_every_column(self, collection):
+        session = HoneypotSession(session_id="s1")
+        session.add_message("scammer", "send otp", "2024-01-01T00:00:00Z", {"lang": "en"})
+        session.add_message("agent", "which otp?")
+
+        assert session.message_count == 2
+        assert session.messages["metadata"] == [{"lang": "en"}, {}]
+        assert session.messages["timestamp"][1].endswith("Z")
+        assert session.scammer_messages == 1
+        assert session.agent_messages == 1
+
+    def test_message_list_round_trips_legacy_shape(self, legacy_session):
+        assert legacy_session.message_list == [{
+            "sender": "scammer",
+            "text": "send otp",
+            "timestamp": "2024-01-01T00:00:00Z",
+            "metadata": {},
+        }]
+        again = HoneypotSession.model_validate({
+            "session_id": "legacy-1",
+            "messages": legacy_session.message_list,
+        })
+        assert again.messages == legacy_session.messages
+
+    def test_history_for_prompt_reads_columns(self, legacy_session):
+        legacy_session.add_message("agent", "which otp?")
+
+        assert legacy_session.get_history_for_prompt() == "Scammer: send otp\nYou: which otp?"
+        assert legacy_session.get_history_for_prompt(max_messages=1) == "You: which otp?"
+
+
+# ===========================================
+# API KEY HASHES
+# ===========================================
+
+class TestAPIKeyHash:
+    """Tests for raw-bytes key_hash storage with the hex fallback."""
+
+    def test_hash_is_raw_digest(self):
+        digest = APIKey.hash_key(RAW_KEY)
+
+        assert isinstance(digest, bytes)
+        assert digest == hashlib.sha256(RAW_KEY.encode("utf-8")).digest()
+
+    def test_generated_key_verifies(self):
+        raw_key, key_hash = APIKey.generate_key()
+
+        assert raw_key.startswith("sk_live_")
+        assert APIKey.verify(raw_key, key_hash)
+        assert not APIKey.verify(raw_key + "x", key_hash)
+
+    def test_legacy_hex_hash_is_decoded(self, legacy_api_key):
+        assert legacy_api_key.key_hash == APIKey.hash_key(RAW_KEY)
+        assert APIKey.verify(RAW_KEY, legacy_api_key.key_hash)
+
+    async def test_lookup_matches_both_stored_forms(self, legacy_api_key, monkeypatch):
+        find_one = AsyncMock(return_value=legacy_api_key)
+        monkeypatch.setattr(APIKey, "find_one", find_one)
+        monkeypatch.setattr(APIKey, "record_usage", AsyncMock())
+
+        assert await APIKeyService.validate_api_key(RAW_KEY) is legacy_api_key
+
+        key_hash = APIKey.hash_key(RAW_KEY)
+        find_one.assert_awaited_once_with({"key_hash": {"$in": [key_hash, key_hash.hex()]}})
+
+    async def test_lookup_rejects_wrong_key(self, legacy_api_key, monkeypatch):
+        monkeypatch.setattr(APIKey, "find_one", AsyncMock(return_value=legacy_api_key))
+        monkeypatch.setattr(APIKey, "record_usage", AsyncMock())
+
+        assert await APIKeyService.validate_api_key("sk_live_other-key") is None
@@ -0,0 +1,94 @@
+# ===========================================
+# ScamShield Validator Tests
+# ===========================================
+# Run with: pytest tests/test_validators.py -v
+# ===========================================
+
+import pytest
+
+from app.core.validators import (
+    EmailValidator,
+    PhoneValidator,
+    validate_email_not_disposable,
+    validate_indian_phone,
+)
+
+
+# ===========================================
+# PHONE VALIDATION
+# ===========================================
+
+class TestIndianPhone:
+    """Tests for Indian phone number validation and normalization."""
+
+    @pytest.mark.parametrize("phone", [
+        "9876543210",
+        "09876543210",
+        "0 98765 43210",
+        "+919876543210",
+        "91-9876543210",
+        "+91-9876543210",
+    ])
+    def test_accepted_formats(self, phone):
+        assert PhoneValidator.validate_indian(phone) == (True, None)
+        assert PhoneValidator.normalize(phone) == "+919876543210"
+
+    def test_leading_zero_is_trunk_prefix(self):
+        """11 digits with a leading 0 drop the 0, not the last digit."""
+        assert validate_indian_phone("09876543210") == "+919876543210"
+
+    @pytest.mark.parametrize("phone", [
+        "05876543210",     # subscriber number must start with 6-9
+        "19876543210",     # 11 digits without the 0 trunk prefix
+        "+09876543210",    # "+" only goes with the 91 prefix
+        "098765432101",    # 12 digits not starting with 91
+        "0987654321",      # 10 digits starting with 0
+    ])
+    def test_rejected_formats(self, phone):
+        is_valid, error = PhoneValidator.validate_indian(phone)
+        assert not is_valid
+        assert error == "Invalid Indian phone number format"
+        with pytest.raises(ValueError):
+            validate_indian_phone(phone)
+
+    def test_empty_phone_is_optional(self):
+        assert PhoneValidator.validate_indian("") == (True, None)
+        assert validate_indian_phone(None) is None
+
+
+# ===========================================
+# EMAIL VALIDATION
+# ===========================================
+
+class TestDisposableEmail:
+    """Tests for disposable email domain matching."""
+
+    @pytest.mark.parametrize("email", [
+        "user@mailinator.com",
+        "user@MAILINATOR.COM",
+        "user@sub.mailinator.com",
+        "user@a.b.yopmail.com",
+    ])
+    def test_blocked_domain_and_subdomains(self, email):
+        assert EmailValidator.is_disposable(email)
+        assert EmailValidator.validate(email) == (
+            False, "Disposable email addresses are not allowed"
+        )
+
+    @pytest.mark.parametrize("email", [
+        "user@gmail.com",
+        "user@notmailinator.com",
+        "user@mailinator.com.example.org",
+        "user@com",
+    ])
+    def test_lookalike_domains_are_allowed(self, email):
+        assert not EmailValidator.is_disposable(email)
+
+    def test_malformed_input(self):
+        assert not EmailValidator.is_disposable("no-at-sign")
+        assert not EmailValidator.is_disposable(None)
+
+    def test_pydantic_validator_rejects_subdomain(self):
+        with pytest.raises(ValueError):
+            validate_email_not_disposable("user@sub.tempmail.com")
+        assert validate_email_not_disposable("User@Example.com") == "user@example.com"